@@ -10,82 +10,71 @@ import subprocess
 import argparse
 import json
 import glob
-from typing import Optional, Dict
+import hashlib
+import tempfile
+import contextlib
+import multiprocessing
+import concurrent.futures
+import threading
+import mmap
+import re
+from typing import Optional, Dict, Iterator, List, Any
 
-class MovieAnalyzer:
-    def __init__(self, movie_folder: str):
-        self.movie_folder = movie_folder
-        self.movie_name = os.path.basename(movie_folder.rstrip('/'))
-        self.metadata_path = os.path.join(movie_folder, 'metadata.json')
-        self.srt_path = self._find_english_subtitle()
-        
-    def _find_english_subtitle(self) -> str:
-        """Find the English subtitle file in the movie folder."""
-        # Look for files ending with _EN.srt first
-        en_pattern = os.path.join(self.movie_folder, '*_EN.srt')
-        en_files = glob.glob(en_pattern)
-        
-        if en_files:
-            return en_files[0]
-        
-        # Fallback to any .srt file
-        srt_pattern = os.path.join(self.movie_folder, '*.srt')
-        srt_files = glob.glob(srt_pattern)
-        
-        if srt_files:
-            return srt_files[0]
-        
-        raise FileNotFoundError(f"No subtitle file found in {self.movie_folder}")
-    
-    def read_analysis_prompt_template(self) -> str:
-        """Read the analysis prompt template."""
-        template_path = os.path.join(os.path.dirname(__file__), 'analyze_subtitles_prompt.md')
-        
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Analysis prompt template not found: {template_path}")
-        
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        return template_content
-    
-    def read_subtitle_content(self) -> str:
-        """Read subtitle content with automatic encoding detection."""
-        # Try common encodings in order of likelihood
-        encodings = ['utf-8', 'utf-8-sig', 'windows-1252', 'iso-8859-1', 'cp1252', 'latin1']
-        
-        for encoding in encodings:
-            try:
-                with open(self.srt_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                print(f"✓ Successfully read subtitle file using {encoding} encoding")
-                return content
-            except UnicodeDecodeError:
-                continue
-        
-        # If all encodings fail, try with error handling
-        try:
-            with open(self.srt_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            print("⚠ Warning: Some characters may be corrupted due to encoding issues")
-            return content
-        except Exception as e:
-            raise ValueError(f"Unable to read subtitle file: {e}")
-    
-    def create_analysis_prompt(self) -> str:
-        """Create the complete analysis prompt with subtitle content injected."""
-        # Read the template
-        template = self.read_analysis_prompt_template()
-        
-        # Read subtitle content with encoding detection
-        subtitle_content = self.read_subtitle_content()
-        
-        # Create the analysis prompt by extracting the core prompt and injecting subtitle content
-        analysis_prompt = """You are an expert film analyst. Analyze the provided English subtitle file and generate structured metadata for translation purposes. 
+try:
+    import charset_normalizer
+except ImportError:  # Optional dependency, used for non-UTF-8 subtitles
+    charset_normalizer = None
 
-**TASK:** Create a comprehensive JSON metadata file with the following information:
+try:
+    import orjson
+except ImportError:  # Optional dependency, faster JSON parsing and serialization
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, incremental parsing of stream-json output
+    ijson = None
+
+try:
+    from pydantic import BaseModel, ConfigDict, Field
+except ImportError:  # Optional dependency, used for full metadata validation
+    BaseModel = None
+
+from claude_session import ClaudeSession
+
+# Persistent cache of validated analysis results, keyed by prompt content
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.subs-translate-cc', 'llm_cache')
+
+# Per-movie dialogue budget when several movies share one batch prompt
+DEFAULT_BATCH_MAX_CHARS = 40000
 
-```json
+# Subtitle text budget for the analysis prompt; longer dialogue is sampled
+# from the beginning, middle and end of the film
+MAX_PROMPT_CHARS = 60000
+
+# Below this much dialogue there is too little signal for a useful analysis,
+# so a stub metadata.json is written instead of calling Claude Code
+MIN_DIALOGUE_CHARS = 1000
+
+# SRT structure stripped before analysis (only the dialogue is useful to Claude)
+_SRT_INDEX_RE = re.compile(r'^\d+$')
+_SRT_TIMING_RE = re.compile(r'^\d\d:\d\d:\d\d[,.]\d+ --> .*$')
+_HTML_TAG_RE = re.compile(r'</?[a-zA-Z][^>]*>')
+
+# JSON extraction from Claude responses
+_JSON_BLOCK_RE = re.compile(r'```json\s*\n(.*?)\n```', re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r'```\s*\n(.*?)\n```', re.DOTALL)
+
+# Optional cross-process limit on concurrent Claude Code invocations (set in --jobs workers)
+_claude_semaphore = None
+
+# Claude Code processes started one movie ahead by a --jobs worker (with --reuse-session)
+_reuse_session = False
+_worker_session = None
+_unclaimed_movies = None  # shared count of movies no worker has picked up yet
+
+# JSON structure Claude is asked to produce for each movie
+METADATA_SCHEMA = """```json
 {
   "film_metadata": {
     "genre": "string - primary genre (drama, comedy, action, etc.)",
@@ -123,7 +112,13 @@ class MovieAnalyzer:
   },
   "story_summary": "2-3 sentence summary of the plot for translation context"
 }
-```
+```"""
+
+ANALYSIS_PROMPT = """You are an expert film analyst. Analyze the provided English subtitle file and generate structured metadata for translation purposes. 
+
+**TASK:** Create a comprehensive JSON metadata file with the following information:
+
+""" + METADATA_SCHEMA + """
 
 **INSTRUCTIONS:**
 1. Read through ALL the subtitle content carefully
@@ -139,59 +134,420 @@ class MovieAnalyzer:
 ```
 
 Respond with ONLY the JSON metadata, no additional explanation or markdown formatting."""
+
+# The analysis prompt around the subtitle content, streamed to Claude piece by piece
+ANALYSIS_PROMPT_PREFIX, ANALYSIS_PROMPT_SUFFIX = ANALYSIS_PROMPT.split("{subtitle_content}")
+
+BATCH_ANALYSIS_PROMPT = """You are an expert film analyst. Analyze each of the provided English subtitle files and generate structured metadata for translation purposes. Each movie's subtitles are enclosed between a <<<MOVIE:name>>> line and an <<<END>>> line.
+
+**TASK:** For EACH movie, create a comprehensive JSON metadata object with the following information:
+
+""" + METADATA_SCHEMA + """
+
+**INSTRUCTIONS:**
+1. Read through ALL the subtitle content of each movie carefully
+2. Analyze every movie independently - do not mix up characters or themes between movies
+3. Identify patterns in dialogue and character interactions
+4. Detect cultural, religious, or regional references
+5. Note the emotional register and formality level
+6. Create translation-specific guidance based on the content
+7. Respond with ONLY a single JSON object mapping each movie name (exactly as written in its MOVIE marker) to its metadata object
+
+**SUBTITLE FILES TO ANALYZE:**
+{subtitle_sections}
+
+Respond with ONLY the JSON object, no additional explanation or markdown formatting."""
+
+if BaseModel is not None:
+    class _MetadataSection(BaseModel):
+        # Claude may add extra fields; keep them rather than rejecting the analysis
+        model_config = ConfigDict(extra='allow')
+    
+    class FilmMetadata(_MetadataSection):
+        genre: str
+        subgenres: List[str] = []
+        setting: Dict[str, Any] = {}
+        tone: Optional[str] = None
+    
+    class Characters(_MetadataSection):
+        main_characters: List[str]
+        secondary_characters: List[str] = []
+        character_relationships: Optional[str] = None
+    
+    class Themes(_MetadataSection):
+        primary_themes: List[str] = []
+        cultural_elements: List[str] = []
+        sensitive_topics: List[str] = []
+    
+    class TranslationContext(_MetadataSection):
+        target_language: Optional[str] = None
+        # 'register' would shadow a BaseModel attribute
+        register_: Optional[str] = Field(None, alias='register')
+        special_terminology: Dict[str, List[str]] = {}
+        translation_notes: List[str] = []
+    
+    class MovieMetadata(_MetadataSection):
+        film_metadata: FilmMetadata
+        characters: Characters
+        themes: Themes
+        translation_context: TranslationContext
+        story_summary: str
+
+def _compress_srt(content: str, max_chars: int = MAX_PROMPT_CHARS) -> str:
+    """Reduce SRT content to its dialogue for analysis.
+    
+    Drops sequence numbers, timing lines and HTML tags, collapses repeated
+    lines, and samples evenly spaced windows if the dialogue is still longer
+    than max_chars.
+    """
+    lines = []
+    previous = None
+    for line in content.lstrip('\ufeff').splitlines():
+        line = line.strip()
+        if _SRT_INDEX_RE.match(line) or _SRT_TIMING_RE.match(line):
+            continue
+        line = _HTML_TAG_RE.sub('', line).strip()
+        if not line or line == previous:
+            continue
+        lines.append(line)
+        previous = line
+    
+    dialogue = '\n'.join(lines)
+    if len(dialogue) <= max_chars:
+        return dialogue
+    
+    # Take first, middle and last windows
+    window = max_chars // 3
+    middle = (len(dialogue) - window) // 2
+    return '\n[…]\n'.join([
+        dialogue[:window],
+        dialogue[middle:middle + window],
+        dialogue[-window:]
+    ])
+
+def _stub_metadata() -> Dict:
+    """Minimal metadata for subtitles too short to analyze."""
+    return {
+        "film_metadata": {"genre": "unknown", "subgenres": [], "setting": {}, "tone": "unknown"},
+        "characters": {"main_characters": [], "secondary_characters": [], "character_relationships": ""},
+        "themes": {"primary_themes": [], "cultural_elements": [], "sensitive_topics": []},
+        "translation_context": {
+            "target_language": "Romanian",
+            "register": "",
+            "special_terminology": {"proper_nouns": [], "cultural_terms": [], "technical_terms": []},
+            "translation_notes": []
+        },
+        "story_summary": ""
+    }
+
+def _claude_command(claude_code_cmd: str, model: Optional[str]) -> List[str]:
+    """Build the Claude Code command line, selecting a model if requested."""
+    cmd = [claude_code_cmd]
+    if model:
+        cmd += ["--model", model]
+    return cmd
+
+def _claude_slot():
+    """Context manager holding a Claude Code slot when a concurrency limit is set."""
+    if _claude_semaphore is None:
+        return contextlib.nullcontext()
+    return _claude_semaphore
+
+def _init_worker(semaphore, reuse_session: bool = False, unclaimed_movies=None) -> None:
+    """Initialize a --jobs worker process."""
+    global _claude_semaphore, _reuse_session, _unclaimed_movies
+    _claude_semaphore = semaphore
+    _reuse_session = reuse_session
+    _unclaimed_movies = unclaimed_movies
+
+def _analyze_folder(folder: str, options: Dict) -> bool:
+    """Analyze a single movie folder (runs in a --jobs worker process)."""
+    global _worker_session
+    try:
+        more_movies = False
+        if _unclaimed_movies is not None:
+            with _unclaimed_movies.get_lock():
+                _unclaimed_movies.value -= 1
+                more_movies = _unclaimed_movies.value > 0
+        if _reuse_session and _worker_session is None:
+            # Lives as long as the worker; a waiting Claude Code exits when its stdin closes
+            _worker_session = ClaudeSession(options['claude_code_cmd'], options.get('model'))
+        # Only start the next process ahead while movies remain for the workers to pick up
+        return MovieAnalyzer(folder).analyze_movie(session=_worker_session, prestart=more_movies,
+                                                   **options)
+    except Exception as e:
+        print(f"✗ Error analyzing {folder}: {e}")
+        return False
+
+class _JsonObjectScanner:
+    """Incrementally find complete top-level JSON objects in streamed text.
+    
+    Tracks brace depth while honoring string literals, so braces inside
+    quoted values do not affect the result.
+    """
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.parts = []
+    
+    def feed(self, text: str) -> Iterator[str]:
+        """Consume more text, yielding every object it completes.
         
-        # Use string replacement instead of format to avoid issues with braces in subtitle content
-        analysis_prompt = analysis_prompt.replace("{subtitle_content}", subtitle_content)
+        Exhaust the iterator before feeding more text, so no part is skipped.
+        """
+        start = 0 if self.depth else None
+        for i, ch in enumerate(text):
+            if self.depth == 0:
+                if ch == '{':
+                    start = i
+                    self.depth = 1
+                continue
+            
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch == '{':
+                self.depth += 1
+            elif ch == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    self.parts.append(text[start:i + 1])
+                    obj = ''.join(self.parts)
+                    self.parts = []
+                    # Keep scanning: the rest of this text may hold the next object
+                    yield obj
         
-        return analysis_prompt
+        if self.depth:
+            self.parts.append(text[start:])
+
+# Where assistant text lives in Claude Code stream-json events
+_STREAM_TEXT_FIELDS = {
+    'event.delta.text': 'delta',             # partial text of a stream_event
+    'message.content.item.text': 'message',  # text block of a full assistant message
+    'result': 'result'                       # final answer of the result event
+}
+
+def _iter_stream_text(stdout):
+    """Yield (kind, text) for the assistant text in Claude Code stream-json output."""
+    if ijson is not None:
+        # Pick only the text fields out of each event instead of building every event
+        # object. Read from the raw pipe, which returns data as soon as it arrives.
+        event_type = None
+        for prefix, event, value in ijson.parse(stdout.buffer.raw, multiple_values=True):
+            if prefix == 'type' and event == 'string':
+                event_type = value
+            elif event == 'string' and prefix in _STREAM_TEXT_FIELDS:
+                kind = _STREAM_TEXT_FIELDS[prefix]
+                if kind != 'message' or event_type == 'assistant':
+                    yield kind, value
+        return
+    
+    for line in stdout:
+        try:
+            event = _json_loads(line)
+        except json.JSONDecodeError:
+            continue
+        
+        event_type = event.get('type')
+        if event_type == 'stream_event':
+            delta = event.get('event', {}).get('delta', {})
+            if delta.get('type') == 'text_delta':
+                yield 'delta', delta.get('text', '')
+        elif event_type == 'assistant':
+            for block in event.get('message', {}).get('content', []):
+                if block.get('type') == 'text':
+                    yield 'message', block.get('text', '')
+        elif event_type == 'result':
+            yield 'result', event.get('result', '')
+
+def _json_loads(data):
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> str:
+    """Serialize to indented, non-ASCII-escaped JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _atomic_write_text(path: str, text: str) -> None:
+    """Write text to path atomically via a .tmp sibling and os.replace."""
+    # Per-process name: --jobs workers analyzing identical content share a cache path
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+def _first_balanced_json(text: str) -> Optional[str]:
+    """Return the first balanced top-level {...} object in text, if any."""
+    return next(_JsonObjectScanner().feed(text), None)
+
+def find_movie_folders(parent: str) -> List[str]:
+    """List subfolders of parent that contain a subtitle file."""
+    folders = []
+    for name in sorted(os.listdir(parent)):
+        folder = os.path.join(parent, name)
+        if os.path.isdir(folder) and glob.glob(os.path.join(folder, '*.srt')):
+            folders.append(folder)
+    return folders
+
+class MovieAnalyzer:
+    def __init__(self, movie_folder: str):
+        self.movie_folder = movie_folder
+        self.movie_name = os.path.basename(movie_folder.rstrip('/'))
+        self.metadata_path = os.path.join(movie_folder, 'metadata.json')
+        self.srt_path = self._find_english_subtitle()
+        
+    def _find_english_subtitle(self) -> str:
+        """Find the English subtitle file in the movie folder."""
+        # Prefer files ending with _EN.srt, fall back to any .srt file
+        fallback = None
+        with os.scandir(self.movie_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or not name.endswith('.srt'):
+                    continue
+                if name.endswith('_EN.srt'):
+                    return os.path.join(self.movie_folder, name)
+                if fallback is None:
+                    fallback = os.path.join(self.movie_folder, name)
+        
+        if fallback:
+            return fallback
+        
+        raise FileNotFoundError(f"No subtitle file found in {self.movie_folder}")
+    
+    def read_subtitle_content(self) -> str:
+        """Read subtitle content with automatic encoding detection."""
+        try:
+            with open(self.srt_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # mmap cannot map an empty file
+                    return ''
+                else:
+                    # Fast path: most subtitle files are UTF-8 (with or without BOM),
+                    # decode straight from the mapped pages without an intermediate copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        try:
+                            content = str(mm, 'utf-8-sig')
+                            print("✓ Successfully read subtitle file using utf-8 encoding")
+                            return content
+                        except UnicodeDecodeError:
+                            raw = mm[:]
+        except OSError as e:
+            raise ValueError(f"Unable to read subtitle file: {e}")
+        
+        # Detect the encoding from the bytes already in memory
+        if charset_normalizer is not None:
+            best = charset_normalizer.from_bytes(raw).best()
+            if best is not None:
+                print(f"✓ Successfully read subtitle file using {best.encoding} encoding")
+                return str(best)
+        else:
+            for encoding in ('windows-1252', 'latin1'):
+                try:
+                    content = raw.decode(encoding)
+                    print(f"✓ Successfully read subtitle file using {encoding} encoding")
+                    return content
+                except UnicodeDecodeError:
+                    continue
+        
+        print("⚠ Warning: Some characters may be corrupted due to encoding issues")
+        return raw.decode('utf-8', errors='replace')
+    
+    def create_analysis_prompt_parts(self, subtitle_content: Optional[str] = None,
+                                     max_chars: int = MAX_PROMPT_CHARS) -> List[str]:
+        """Create the analysis prompt as [prefix, subtitle content, suffix]."""
+        # Read subtitle content with encoding detection
+        if subtitle_content is None:
+            subtitle_content = self.read_subtitle_content()
+        
+        # Keep the subtitle content separate so the full prompt never has to be built
+        return [ANALYSIS_PROMPT_PREFIX, _compress_srt(subtitle_content, max_chars), ANALYSIS_PROMPT_SUFFIX]
+    
+    def create_analysis_prompt(self, subtitle_content: Optional[str] = None) -> str:
+        """Create the complete analysis prompt with subtitle content injected."""
+        return ''.join(self.create_analysis_prompt_parts(subtitle_content))
     
     def extract_json_from_response(self, response_text: str) -> str:
         """Extract JSON from Claude response that may contain markdown formatting."""
         response_text = response_text.strip()
         
         # Look for JSON in ```json blocks
-        import re
-        json_match = re.search(r'```json\s*\n(.*?)\n```', response_text, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(response_text)
         if json_match:
             return json_match.group(1).strip()
         
         # Look for JSON in ``` blocks
-        code_match = re.search(r'```\s*\n(.*?)\n```', response_text, re.DOTALL)
+        code_match = _CODE_BLOCK_RE.search(response_text)
         if code_match:
             potential_json = code_match.group(1).strip()
             if potential_json.startswith('{') and potential_json.endswith('}'):
                 return potential_json
         
-        # Look for content that starts and ends with braces
-        brace_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if brace_match:
-            return brace_match.group(0)
+        # Look for the first balanced {...} object
+        balanced = _first_balanced_json(response_text)
+        if balanced:
+            return balanced
         
         # Return original if no patterns found
         return response_text
 
+    @staticmethod
+    def check_metadata_structure(metadata: Dict) -> None:
+        """Check that parsed metadata has the required structure."""
+        if BaseModel is not None:
+            # Raises pydantic.ValidationError (a ValueError) listing every problem
+            MovieMetadata.model_validate(metadata)
+            return
+        
+        # Basic structure validation
+        required_keys = ['film_metadata', 'characters', 'themes', 'translation_context', 'story_summary']
+        for key in required_keys:
+            if key not in metadata:
+                raise ValueError(f"Missing required key: {key}")
+        
+        # Validate film_metadata structure
+        if 'genre' not in metadata['film_metadata']:
+            raise ValueError("Missing genre in film_metadata")
+        
+        # Validate characters structure
+        if 'main_characters' not in metadata['characters']:
+            raise ValueError("Missing main_characters in characters")
+    
     def validate_json_metadata(self, raw_response: str) -> Dict:
         """Extract and validate JSON metadata from Claude response."""
+        json_text = raw_response.strip()
         try:
-            # Extract JSON from markdown formatting
-            json_text = self.extract_json_from_response(raw_response)
-            
-            # Try to parse the JSON
-            metadata = json.loads(json_text)
-            
-            # Basic structure validation
-            required_keys = ['film_metadata', 'characters', 'themes', 'translation_context', 'story_summary']
-            for key in required_keys:
-                if key not in metadata:
-                    raise ValueError(f"Missing required key: {key}")
-            
-            # Validate film_metadata structure
-            if 'genre' not in metadata['film_metadata']:
-                raise ValueError("Missing genre in film_metadata")
+            try:
+                # Claude is asked for bare JSON, so try that before any extraction
+                metadata = _json_loads(json_text)
+            except json.JSONDecodeError:
+                # Extract JSON from markdown formatting
+                json_text = self.extract_json_from_response(raw_response)
+                metadata = _json_loads(json_text)
             
-            # Validate characters structure
-            if 'main_characters' not in metadata['characters']:
-                raise ValueError("Missing main_characters in characters")
+            self.check_metadata_structure(metadata)
             
             print("✓ JSON metadata validated successfully")
             return metadata
@@ -205,8 +561,167 @@ Respond with ONLY the JSON metadata, no additional explanation or markdown forma
         except Exception as e:
             raise ValueError(f"Metadata validation failed: {e}")
     
-    def analyze_movie(self, claude_code_cmd: str = "claude-code", force: bool = False) -> bool:
-        """Analyze the movie and generate metadata.json."""
+    def _cache_key(self, claude_code_cmd: str, prompt_parts: List[str], model: Optional[str] = None) -> str:
+        """Compute the cache key for an analysis request."""
+        digest = hashlib.sha256((claude_code_cmd + "\0").encode('utf-8'))
+        if model:
+            digest.update(f"model={model}\0".encode('utf-8'))
+        for part in prompt_parts:
+            digest.update(part.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def load_cached_metadata(self, cache_dir: str, key: str) -> Optional[Dict]:
+        """Load previously validated metadata from the cache, if present."""
+        cache_path = os.path.join(cache_dir, f"{key}.json")
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            # Treat unreadable cache entries as misses
+            return None
+    
+    def save_cached_metadata(self, cache_dir: str, key: str, metadata: Dict) -> None:
+        """Store validated metadata in the cache (written atomically)."""
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            _atomic_write_text(os.path.join(cache_dir, f"{key}.json"), _json_dumps(metadata))
+        except OSError as e:
+            # The cache is an optimization; never fail an analysis over it
+            print(f"⚠ Warning: Could not write analysis cache: {e}")
+    
+    @staticmethod
+    def _write_prompt(stdin, prompt_parts: List[str]) -> None:
+        """Write the prompt pieces to the child's stdin, then close it."""
+        try:
+            for part in prompt_parts:
+                stdin.write(part)
+            stdin.close()
+        except BrokenPipeError:
+            # The child exited early; its stderr explains why
+            pass
+    
+    def run_claude(self, claude_code_cmd: str, prompt_parts: List[str], timeout: int = 600,
+                   model: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run Claude Code, feeding the prompt pieces directly to its stdin."""
+        cmd = _claude_command(claude_code_cmd, model)
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, text=True, encoding='utf-8')
+        
+        # A thread feeds the pieces while communicate() drains stdout/stderr, so the
+        # full prompt is never joined and a child filling its output pipes can't
+        # deadlock the write; stdin is detached first since communicate() would close it
+        stdin, proc.stdin = proc.stdin, None
+        writer = threading.Thread(target=self._write_prompt, args=(stdin, prompt_parts), daemon=True)
+        writer.start()
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            writer.join()
+        
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout=stdout, stderr=stderr)
+    
+    def run_claude_streaming(self, claude_code_cmd: str, prompt_parts: List[str], timeout: int = 600,
+                             model: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run Claude Code with stream-json output, stopping once valid metadata arrives.
+        
+        Assistant text is accumulated from the streamed events; as soon as it
+        contains a complete JSON object that passes validation the process is
+        terminated and the object is returned as stdout.
+        """
+        cmd = _claude_command(claude_code_cmd, model) + [
+            "-p", "--output-format", "stream-json", "--verbose", "--include-partial-messages"
+        ]
+        # stderr goes to a file so a chatty child can never block on a full pipe
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as stderr_file:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                    stderr=stderr_file, text=True, encoding='utf-8')
+            
+            # Popen has no overall timeout when reading line by line, so enforce one here
+            timed_out = threading.Event()
+            def on_timeout():
+                timed_out.set()
+                proc.kill()
+            timer = threading.Timer(timeout, on_timeout)
+            timer.start()
+            
+            scanner = _JsonObjectScanner()
+            text_parts = []
+            received = 0
+            saw_deltas = False
+            metadata_json = None
+            
+            try:
+                self._write_prompt(proc.stdin, prompt_parts)
+                
+                # Prefer partial text deltas, then full assistant messages, then the final result
+                for kind, chunk in _iter_stream_text(proc.stdout):
+                    if kind == 'delta':
+                        saw_deltas = True
+                    elif (kind == 'message' and saw_deltas) or (kind == 'result' and text_parts):
+                        continue
+                    
+                    text_parts.append(chunk)
+                    if (received + len(chunk)) // 1000 > received // 1000:
+                        print(f"  ...received {received + len(chunk)} characters", end='\r', flush=True)
+                    received += len(chunk)
+                    
+                    for candidate in scanner.feed(chunk):
+                        try:
+                            self.check_metadata_structure(_json_loads(candidate))
+                        except (ValueError, TypeError, KeyError):
+                            # Not the metadata object; keep looking
+                            continue
+                        metadata_json = candidate
+                        break
+                    
+                    if metadata_json is not None:
+                        # Got everything needed; don't wait for the rest of the answer
+                        proc.terminate()
+                        break
+                
+                proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                for stream in (proc.stdin, proc.stdout):
+                    try:
+                        stream.close()
+                    except BrokenPipeError:
+                        pass
+            
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+        
+        if received >= 1000:
+            print()
+        if metadata_json is not None:
+            return subprocess.CompletedProcess(cmd, 0, stdout=metadata_json, stderr='')
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout=''.join(text_parts), stderr=stderr)
+    
+    def analyze_movie(self, claude_code_cmd: str = "claude-code", force: bool = False,
+                      use_cache: bool = True, cache_dir: str = DEFAULT_CACHE_DIR,
+                      stream: bool = False, model: Optional[str] = None,
+                      max_input_chars: int = MAX_PROMPT_CHARS,
+                      min_chars: int = MIN_DIALOGUE_CHARS,
+                      session: Optional[ClaudeSession] = None, prestart: bool = True) -> bool:
+        """Analyze the movie and generate metadata.json.
+        
+        If a ClaudeSession is given, it answers the analysis prompt instead of
+        a freshly spawned Claude Code process; with prestart it starts the
+        process for the next movie while this one is analyzed.
+        """
         
         # Check if metadata already exists
         if os.path.exists(self.metadata_path) and not force:
@@ -219,24 +734,45 @@ Respond with ONLY the JSON metadata, no additional explanation or markdown forma
         
         try:
             # Create the analysis prompt
-            prompt = self.create_analysis_prompt()
+            prompt_parts = self.create_analysis_prompt_parts(max_chars=max_input_chars)
+            
+            # Too little dialogue to be worth a Claude Code call (sampled
+            # dialogue is never shorter than max_input_chars)
+            dialogue = prompt_parts[1]
+            if len(dialogue) < min(min_chars, max_input_chars):
+                self.write_metadata(_stub_metadata())
+                print(f"✓ Generated stub metadata.json for {self.movie_name} "
+                      f"(only {len(dialogue)} characters of dialogue)")
+                return True
+            
+            # Reuse a previous analysis of identical content if available
+            cache_key = self._cache_key(claude_code_cmd, prompt_parts, model)
+            if use_cache:
+                metadata = self.load_cached_metadata(cache_dir, cache_key)
+                if metadata is not None:
+                    self.write_metadata(metadata)
+                    print(f"✓ Generated metadata.json for {self.movie_name} (from cache)")
+                    return True
             
             # Execute Claude Code with the analysis prompt
             print("Running analysis with Claude Code...")
-            result = subprocess.run(
-                [claude_code_cmd],
-                input=prompt,
-                text=True,
-                capture_output=True,
-                timeout=600  # 10 minutes timeout for analysis
-            )
+            with _claude_slot():
+                if session is not None:
+                    result = session.run(prompt_parts, timeout=600, prestart=prestart)
+                elif stream:
+                    result = self.run_claude_streaming(claude_code_cmd, prompt_parts, model=model)
+                else:
+                    result = self.run_claude(claude_code_cmd, prompt_parts, model=model,
+                                             timeout=600)  # 10 minutes timeout for analysis
             
             if result.returncode == 0:
                 # Validate and save the metadata
                 metadata = self.validate_json_metadata(result.stdout)
                 
-                with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                self.write_metadata(metadata)
+                
+                if use_cache:
+                    self.save_cached_metadata(cache_dir, cache_key, metadata)
                 
                 print(f"✓ Generated metadata.json for {self.movie_name}")
                 return True
@@ -248,6 +784,136 @@ Respond with ONLY the JSON metadata, no additional explanation or markdown forma
             print("✗ Analysis timed out (10 minutes)")
             return False
     
+    def write_metadata(self, metadata: Dict) -> None:
+        """Write validated metadata to metadata.json."""
+        # An interrupted write must never leave a truncated metadata.json behind
+        _atomic_write_text(self.metadata_path, _json_dumps(metadata))
+    
+    @classmethod
+    def batch_analyze(cls, folders: List[str], claude_code_cmd: str = "claude-code", force: bool = False,
+                      use_cache: bool = True, cache_dir: str = DEFAULT_CACHE_DIR,
+                      max_chars: int = DEFAULT_BATCH_MAX_CHARS, model: Optional[str] = None,
+                      min_chars: int = MIN_DIALOGUE_CHARS,
+                      max_input_chars: int = MAX_PROMPT_CHARS) -> int:
+        """Analyze several movies with a single Claude Code invocation.
+        
+        Returns the number of movies that have metadata.json afterwards.
+        """
+        pending = []
+        done = 0
+        for folder in folders:
+            try:
+                analyzer = cls(folder)
+            except FileNotFoundError as e:
+                print(f"⏭  Skipping {folder}: {e}")
+                continue
+            
+            if os.path.exists(analyzer.metadata_path) and not force:
+                print(f"✓ metadata.json already exists for {analyzer.movie_name}")
+                done += 1
+                continue
+            
+            # Movies analyzed individually before (with the same input cap) are served from the cache
+            content = analyzer.read_subtitle_content()
+            prompt_parts = analyzer.create_analysis_prompt_parts(content, max_chars=max_input_chars)
+            if len(prompt_parts[1]) < min(min_chars, max_input_chars):
+                analyzer.write_metadata(_stub_metadata())
+                print(f"✓ Generated stub metadata.json for {analyzer.movie_name} "
+                      f"(only {len(prompt_parts[1])} characters of dialogue)")
+                done += 1
+                continue
+            
+            cache_key = analyzer._cache_key(claude_code_cmd, prompt_parts, model)
+            metadata = analyzer.load_cached_metadata(cache_dir, cache_key) if use_cache else None
+            if metadata is not None:
+                analyzer.write_metadata(metadata)
+                print(f"✓ Generated metadata.json for {analyzer.movie_name} (from cache)")
+                done += 1
+                continue
+            
+            pending.append((analyzer, content))
+        
+        if not pending:
+            return done
+        
+        # Build one prompt with a delimited section per movie
+        prompt_prefix, prompt_suffix = BATCH_ANALYSIS_PROMPT.split("{subtitle_sections}")
+        prompt_parts = [prompt_prefix]
+        for i, (analyzer, content) in enumerate(pending):
+            separator = "\n\n" if i else ""
+            prompt_parts.append(f"{separator}<<<MOVIE:{analyzer.movie_name}>>>\n")
+            prompt_parts.append(_compress_srt(content, max_chars))
+            prompt_parts.append("\n<<<END>>>")
+        prompt_parts.append(prompt_suffix)
+        
+        # Batch answers come from a different prompt, so they are cached under its own key
+        # and never served as an individual analysis
+        batch_key = pending[0][0]._cache_key(claude_code_cmd, prompt_parts, model)
+        results = pending[0][0].load_cached_metadata(cache_dir, batch_key) if use_cache else None
+        if results is not None:
+            print(f"Using cached batch analysis of {len(pending)} movies")
+            return done + cls._save_batch_results(pending, results)
+        
+        print(f"Running batch analysis of {len(pending)} movies with Claude Code...")
+        try:
+            result = pending[0][0].run_claude(claude_code_cmd, prompt_parts, model=model,
+                                              timeout=600 * len(pending))  # 10 minutes per movie
+        except subprocess.TimeoutExpired:
+            print(f"✗ Batch analysis timed out ({10 * len(pending)} minutes)")
+            return done
+        
+        if result.returncode != 0:
+            print(f"✗ Claude Code error: {result.stderr}")
+            return done
+        
+        try:
+            results = _json_loads(pending[0][0].extract_json_from_response(result.stdout))
+        except json.JSONDecodeError as e:
+            print(f"✗ Invalid JSON format in batch response: {e}")
+            return done
+        
+        if not isinstance(results, dict):
+            # Not the requested name -> metadata object; analyze each movie on its own instead
+            print("✗ Batch response is not a JSON object, falling back to per-movie analysis")
+            for analyzer, _ in pending:
+                try:
+                    if analyzer.analyze_movie(claude_code_cmd, force=True, use_cache=use_cache,
+                                              cache_dir=cache_dir, model=model, min_chars=min_chars,
+                                              max_input_chars=max_input_chars):
+                        done += 1
+                except ValueError as e:
+                    # One bad answer must not stop the remaining movies
+                    print(f"✗ Error analyzing {analyzer.movie_name}: {e}")
+            return done
+        
+        saved = cls._save_batch_results(pending, results)
+        if use_cache and saved == len(pending):
+            pending[0][0].save_cached_metadata(cache_dir, batch_key, results)
+        
+        return done + saved
+    
+    @staticmethod
+    def _save_batch_results(pending: List, results: Dict) -> int:
+        """Validate and write each pending movie's metadata from a batch answer."""
+        saved = 0
+        for analyzer, _ in pending:
+            metadata = results.get(analyzer.movie_name)
+            if metadata is None:
+                print(f"✗ No metadata returned for {analyzer.movie_name}")
+                continue
+            
+            try:
+                analyzer.check_metadata_structure(metadata)
+            except (ValueError, TypeError) as e:
+                print(f"✗ Metadata validation failed for {analyzer.movie_name}: {e}")
+                continue
+            
+            analyzer.write_metadata(metadata)
+            print(f"✓ Generated metadata.json for {analyzer.movie_name}")
+            saved += 1
+        
+        return saved
+    
     def show_metadata_info(self) -> None:
         """Show information about existing metadata."""
         if not os.path.exists(self.metadata_path):
@@ -256,7 +922,7 @@ Respond with ONLY the JSON metadata, no additional explanation or markdown forma
         
         try:
             with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+                metadata = _json_loads(f.read())
             
             print(f"Metadata for {self.movie_name}:")
             print(f"Genre: {metadata.get('film_metadata', {}).get('genre', 'Unknown')}")
@@ -279,13 +945,36 @@ Respond with ONLY the JSON metadata, no additional explanation or markdown forma
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(description='Automated movie metadata generation using Claude Code')
-    parser.add_argument('movie_folder', help='Path to the movie folder')
+    parser.add_argument('movie_folder', help='Path to the movie folder (or folder of movies with --batch)')
     parser.add_argument('command', choices=['analyze', 'info'], 
                        help='Command: analyze movie or show metadata info')
     parser.add_argument('--claude-cmd', default='claude', 
                        help='Claude Code command (default: claude-code)')
     parser.add_argument('--force', action='store_true', 
                        help='Force regeneration even if metadata.json exists')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always run Claude Code, ignoring cached analyses')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                       help=f'Analysis cache directory (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--model',
+                       help='Model for Claude Code to use for the analysis (default: Claude Code default)')
+    parser.add_argument('--max-input-chars', type=int, default=MAX_PROMPT_CHARS,
+                       help=f'Max dialogue characters sent for analysis (default: {MAX_PROMPT_CHARS})')
+    parser.add_argument('--min-chars', type=int, default=MIN_DIALOGUE_CHARS,
+                       help=f'Write stub metadata without calling Claude Code below this much dialogue (default: {MIN_DIALOGUE_CHARS})')
+    parser.add_argument('--stream', action='store_true',
+                       help='Stream Claude Code output (stream-json) and stop as soon as the metadata is complete')
+    parser.add_argument('--batch', action='store_true',
+                       help='Analyze every movie subfolder in a single Claude Code call')
+    parser.add_argument('--batch-max-chars', type=int, default=DEFAULT_BATCH_MAX_CHARS,
+                       help=f'Max dialogue characters per movie in batch mode (default: {DEFAULT_BATCH_MAX_CHARS})')
+    parser.add_argument('--jobs', type=int,
+                       help='Analyze every movie subfolder using N parallel worker processes')
+    parser.add_argument('--max-claude', type=int,
+                       help='With --jobs, limit concurrent Claude Code invocations (default: no limit)')
+    parser.add_argument('--reuse-session', action='store_true',
+                       help='With --jobs, start each worker\'s next Claude Code process while its current '
+                            'movie is analyzed, hiding startup time (every movie still gets a fresh conversation)')
     
     if len(sys.argv) == 1:
         parser.print_help()
@@ -293,6 +982,9 @@ def main():
         print("  python analyze_movie.py movies/My_Movie analyze")
         print("  python analyze_movie.py movies/My_Movie info")
         print("  python analyze_movie.py movies/My_Movie analyze --force")
+        print("  python analyze_movie.py movies/My_Movie analyze --model haiku")
+        print("  python analyze_movie.py movies analyze --batch")
+        print("  python analyze_movie.py movies analyze --jobs 4")
         sys.exit(1)
     
     args = parser.parse_args()
@@ -301,14 +993,82 @@ def main():
         print(f"Error: Movie folder {args.movie_folder} not found")
         sys.exit(1)
     
-    analyzer = MovieAnalyzer(args.movie_folder)
+    options = {
+        'claude_code_cmd': args.claude_cmd,
+        'force': args.force,
+        'use_cache': not args.no_cache,
+        'cache_dir': args.cache_dir,
+        'stream': args.stream,
+        'model': args.model,
+        'max_input_chars': args.max_input_chars,
+        'min_chars': args.min_chars
+    }
     
-    if args.command == 'analyze':
-        success = analyzer.analyze_movie(
+    if args.jobs is not None and args.batch:
+        print("Error: --jobs cannot be combined with --batch")
+        sys.exit(1)
+    
+    if args.batch:
+        if args.command != 'analyze':
+            print("Error: --batch is only supported with the 'analyze' command")
+            sys.exit(1)
+        
+        done = MovieAnalyzer.batch_analyze(
+            find_movie_folders(args.movie_folder),
             claude_code_cmd=args.claude_cmd,
-            force=args.force
+            force=args.force,
+            use_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+            max_chars=args.batch_max_chars,
+            model=args.model,
+            min_chars=args.min_chars,
+            max_input_chars=args.max_input_chars
         )
         
+        print(f"\nBatch analysis complete: {done} movies with metadata")
+        if done == 0:
+            sys.exit(1)
+        return
+    
+    if args.jobs is not None:
+        if args.command != 'analyze':
+            print("Error: --jobs is only supported with the 'analyze' command")
+            sys.exit(1)
+        
+        folders = find_movie_folders(args.movie_folder)
+        semaphore = multiprocessing.Semaphore(args.max_claude) if args.max_claude else None
+        unclaimed_movies = multiprocessing.Value('i', len(folders))
+        
+        print(f"Analyzing {len(folders)} movies with {args.jobs} parallel jobs")
+        successful = 0
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                                                    initargs=(semaphore, args.reuse_session,
+                                                              unclaimed_movies)) as executor:
+            futures = {executor.submit(_analyze_folder, folder, options): folder for folder in folders}
+            for future in concurrent.futures.as_completed(futures):
+                name = os.path.basename(futures[future].rstrip('/'))
+                try:
+                    succeeded = future.result()
+                except concurrent.futures.process.BrokenProcessPool as e:
+                    # A worker died (e.g. killed for memory); count its movies as failed
+                    print(f"✗ {name} failed: worker process crashed ({e})")
+                    continue
+                if succeeded:
+                    successful += 1
+                    print(f"✓ [{successful}/{len(folders)}] {name} done")
+                else:
+                    print(f"✗ {name} failed")
+        
+        print(f"\nParallel analysis complete: {successful}/{len(folders)} movies successful")
+        if successful < len(folders):
+            sys.exit(1)
+        return
+    
+    analyzer = MovieAnalyzer(args.movie_folder)
+    
+    if args.command == 'analyze':
+        success = analyzer.analyze_movie(**options)
+        
         if success:
             print(f"\\nNext step: python tools/prep_translation.py {args.movie_folder}")
         else:
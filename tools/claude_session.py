@@ -0,0 +1,129 @@
+"""
+Claude Code Session Helper
+Keeps the next Claude Code process starting while the current prompt is answered.
+Shared by analyze_movie.py and translate_batch.py.
+"""
+
+import json
+import subprocess
+import tempfile
+import threading
+from typing import Optional, Sequence, Union
+
+# One stream-json user message line, written around the JSON-escaped prompt text
+_MESSAGE_HEAD = '{"type": "user", "message": {"role": "user", "content": [{"type": "text", "text": "'
+_MESSAGE_TAIL = '"}]}}\n'
+
+class ClaudeSession:
+    """Claude Code processes started one prompt ahead.
+    
+    Uses Claude Code's stream-json input and output: the prompt is sent as
+    one user message line and its answer ends with a "result" event. A
+    conversation cannot be cleared, so each process answers exactly one
+    prompt (no prompt ever sees another's content or answer). As soon as a
+    prompt is sent the next process is started, so its startup overlaps the
+    answer in flight instead of delaying the next prompt.
+    """
+    
+    def __init__(self, claude_code_cmd: str = "claude-code", model: Optional[str] = None,
+                 cwd: Optional[str] = None):
+        self.cmd = [claude_code_cmd]
+        if model:
+            self.cmd += ["--model", model]
+        self.cmd += ["-p", "--input-format", "stream-json", "--output-format", "stream-json", "--verbose"]
+        self.cwd = cwd
+        self.spare = None  # (process, stderr file) waiting for the next prompt
+    
+    def _start(self):
+        # stderr goes to a file so a chatty child can never block on a full pipe
+        stderr_file = tempfile.TemporaryFile('w+', encoding='utf-8')
+        proc = subprocess.Popen(self.cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=stderr_file, text=True, encoding='utf-8', cwd=self.cwd)
+        return proc, stderr_file
+    
+    @staticmethod
+    def _stop(proc: subprocess.Popen, stderr_file) -> None:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        stderr_file.close()
+    
+    def close(self) -> None:
+        """Stop the Claude Code process waiting for a prompt, if any."""
+        if self.spare is not None:
+            self._stop(*self.spare)
+            self.spare = None
+    
+    def __enter__(self) -> 'ClaudeSession':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def run(self, prompt: Union[str, Sequence[str]], timeout: int = 600,
+            prestart: bool = True) -> subprocess.CompletedProcess:
+        """Send one prompt to a fresh conversation and wait for its complete answer.
+        
+        The prompt may be given as pieces, which are sent without being joined.
+        With prestart, the process for the next prompt starts right after this
+        one is sent; pass False when no further prompt is expected.
+        """
+        prompt_parts = [prompt] if isinstance(prompt, str) else prompt
+        
+        spare, self.spare = self.spare, None
+        if spare is not None and spare[0].poll() is not None:
+            # The waiting process exited on its own
+            self._stop(*spare)
+            spare = None
+        proc, stderr_file = spare or self._start()
+        
+        timed_out = threading.Event()
+        def on_timeout():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(timeout, on_timeout)
+        timer.start()
+        
+        try:
+            try:
+                proc.stdin.write(_MESSAGE_HEAD)
+                for part in prompt_parts:
+                    # Escaping piece by piece yields the same JSON string as escaping the whole
+                    proc.stdin.write(json.dumps(part, ensure_ascii=False)[1:-1])
+                proc.stdin.write(_MESSAGE_TAIL)
+                # One prompt per process: it exits once this answer is done
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+            
+            if prestart:
+                # Start the next prompt's process now so its startup overlaps this answer
+                self.spare = self._start()
+            
+            for line in proc.stdout:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if event.get('type') == 'result':
+                    returncode = 1 if event.get('is_error') else 0
+                    return subprocess.CompletedProcess(self.cmd, returncode,
+                                                       stdout=event.get('result', ''), stderr='')
+            
+            # The process ended without answering
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(self.cmd, timeout)
+            proc.wait()
+            stderr_file.seek(0)
+            return subprocess.CompletedProcess(self.cmd, proc.returncode, stdout='',
+                                               stderr=stderr_file.read())
+        finally:
+            timer.cancel()
+            self._stop(proc, stderr_file)
@@ -7,7 +7,137 @@ Prepares SRT files for translation using Claude Code by chunking and generating
 import re
 import os
 import json
-from typing import List, Dict
+import logging
+import io
+import codecs
+import functools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, List, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import charset_normalizer
+except ImportError:  # Optional dependency, used for non-UTF-8 subtitles
+    charset_normalizer = None
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency, compact parsed-subtitle cache (JSON otherwise)
+    msgpack = None
+
+# Parsed subtitles are cached per movie, keyed by the SRT file's name, size and mtime
+_SUBTITLE_CACHE_VERSION = 4
+_SUBTITLE_CACHE_NAME = 'subs.msgpack' if msgpack is not None else 'subs.json'
+
+logger = logging.getLogger(__name__)
+
+# Byte order marks, checked before any other detection
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+]
+
+# Capitalized words, used as character name candidates
+_NAME_RE = re.compile(r'\b[A-Z][a-z]{2,}\b')
+
+# Common English words that are capitalized but are not names
+_COMMON_WORDS = frozenset({'The', 'And', 'But', 'You', 'Are', 'Can', 'Was', 'Not', 'Now', 'Get', 'Got', 'Let', 'Put', 'How', 'Why', 'Who', 'What', 'When', 'Where', 'They', 'She', 'Him', 'Her', 'His', 'All', 'One', 'Two', 'Yes', 'Out', 'Off', 'Run', 'Come', 'Take', 'Make', 'Look', 'See', 'Know', 'Think', 'Want', 'Like', 'Time', 'Good', 'Bad', 'Big', 'Old', 'New', 'Right', 'Left', 'Long', 'Last', 'Next', 'First', 'Best', 'Day', 'Night', 'Here', 'There', 'Back', 'Down', 'Over', 'After', 'Before'})
+
+# SRT files are decoded in blocks of this many bytes, so memory stays bounded
+_READ_BLOCK_SIZE = 64 * 1024
+
+# Tried in order once the sniffed encoding meets a byte it cannot decode;
+# latin-1 maps every byte, so nothing is ever replaced
+_FALLBACK_ENCODINGS = ('cp1252', 'latin-1')
+
+# Threads used to write chunk and prompt files
+_WRITE_WORKERS = 8
+
+# Translation prompt text around each chunk's SRT block
+_PROMPT_PREFIX = """Translate the following English subtitles to Romanian while:
+1. Preserving the exact SRT timing format (XX:XX:XX,XXX --> XX:XX:XX,XXX)
+2. Keeping sequence numbers identical
+3. Maintaining dialogue formatting (dashes, ellipses, etc.)
+4. Preserving character names exactly as shown
+5. Using natural Romanian that matches the emotional tone
+6. Properly translating idioms and cultural references
+7. Maintaining the same line structure where possible
+
+Translate this chunk:
+
+"""
+_PROMPT_SUFFIX = """
+
+Respond with ONLY the translated SRT format, no additional explanation."""
+
+def _write_utf8(path: str, text: str) -> None:
+    """Write text as UTF-8 in one binary write, skipping the text-mode encoder."""
+    Path(path).write_bytes(text.encode('utf-8'))
+
+@functools.lru_cache(maxsize=1024)
+def _format_genre(genre: str) -> str:
+    """Format the story context genre line."""
+    return f"GENRE: {genre.title()}"
+
+@functools.lru_cache(maxsize=1024)
+def _format_joined(label: str, items: Tuple[str, ...]) -> str:
+    """Format a story context line listing comma-separated items."""
+    return f"{label}: {', '.join(items)}"
+
+class Subtitle(NamedTuple):
+    """One parsed SRT block."""
+    sequence: int
+    timing: str
+    text: str
+
+def _batched(items: Iterable[Subtitle], size: int) -> Iterator[List[Subtitle]]:
+    """Yield successive lists of up to size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+class _FallbackDecoder:
+    """Incremental decoder that moves on to the fallback encodings at the first invalid byte.
+    
+    The encoding sniffed from the first 4 KB is only a guess (a cp1252 file may
+    start with plain ASCII), so everything from the first byte it cannot decode
+    is decoded strictly with the next fallback instead.
+    """
+    
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._fallbacks = [name for name in _FALLBACK_ENCODINGS
+                           if codecs.lookup(name).name != codecs.lookup(encoding).name]
+        self._fed = 0
+    
+    def decode(self, data: bytes, final: bool = False) -> str:
+        self._fed += len(data)
+        parts = []
+        while True:
+            buffered, flag = self._decoder.getstate()
+            try:
+                parts.append(self._decoder.decode(data, final))
+                return ''.join(parts)
+            except UnicodeDecodeError as e:
+                if not self._fallbacks:
+                    raise
+                # e.object is what the codec saw (utf-8-sig drops the BOM first)
+                pending = buffered + data
+                bad = len(pending) - len(e.object) + e.start
+                
+                # Keep everything that decoded cleanly, then continue with the fallback
+                self._decoder.setstate((b'', flag))
+                parts.append(self._decoder.decode(pending[:bad]))
+                fallback = self._fallbacks.pop(0)
+                print(f"Warning: Subtitle file is not valid {self.encoding} from byte "
+                      f"{self._fed - len(pending) + bad}, reading the rest as {fallback}")
+                self.encoding = fallback
+                self._decoder = codecs.getincrementaldecoder(fallback)()
+                data = pending[bad:]
 
 class SRTProcessor:
     def __init__(self, movie_folder: str):
@@ -16,6 +146,7 @@ class SRTProcessor:
         self.srt_path = self._find_english_subtitle()
         self.metadata_path = os.path.join(movie_folder, 'metadata.json')
         self.chunks_dir = os.path.join(movie_folder, 'chunks')
+        self.cache_dir = os.path.join(movie_folder, '.cache')
         self.prompts_dir = os.path.join(movie_folder, 'translation_prompts')
         self.subtitles = []
         self.story_context = ""
@@ -25,77 +156,234 @@ class SRTProcessor:
         os.makedirs(self.chunks_dir, exist_ok=True)
         os.makedirs(self.prompts_dir, exist_ok=True)
         
-    def read_srt_with_encoding_detection(self) -> str:
-        """Read SRT file content with automatic encoding detection."""
-        encodings = ['utf-8', 'utf-16-le', 'utf-8-sig', 'iso-8859-1', 'cp1252', 'latin1', 'windows-1252']
+    def detect_encoding(self) -> str:
+        """Detect the encoding of the SRT file from its first 4 KB."""
+        with open(self.srt_path, 'rb') as f:
+            head = f.read(4096)
         
-        for encoding in encodings:
-            try:
-                with open(self.srt_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                print(f"✓ Successfully read subtitle file using {encoding} encoding")
-                return content
-            except UnicodeDecodeError:
-                continue
+        encoding = self._sniff_encoding(head)
+        print(f"✓ Successfully read subtitle file using {encoding} encoding")
+        return encoding
+    
+    @staticmethod
+    def _sniff_encoding(head: bytes) -> str:
+        """Pick an encoding from a file prefix."""
+        for bom, encoding in _BOMS:
+            if head.startswith(bom):
+                return encoding
         
-        # Fallback with error handling
+        # UTF-16 without BOM: ASCII text has a NUL in every other byte
+        if head and head[1::2].count(0) > len(head) // 4:
+            return 'utf-16-le'
+        
+        try:
+            # Incremental decode tolerates a multi-byte character cut at 4 KB
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=len(head) < 4096)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        if charset_normalizer is not None:
+            best = charset_normalizer.from_bytes(head).best()
+            if best is not None:
+                return best.encoding
+        
+        return 'cp1252'
+    
+    def read_srt_with_encoding_detection(self) -> str:
+        """Read SRT file content with automatic encoding detection."""
+        return ''.join(self._iter_text(self.detect_encoding()))
+    
+    def _iter_text(self, encoding: str) -> Iterator[str]:
+        """Decode the SRT file block by block, translating newlines like text mode."""
         try:
-            with open(self.srt_path, 'r', encoding='utf-8', errors='replace') as f:
-                return f.read()
+            decoder = io.IncrementalNewlineDecoder(_FallbackDecoder(encoding), translate=True)
+            f = open(self.srt_path, 'rb')
         except Exception as e:
             raise ValueError(f"Unable to read subtitle file: {e}")
-    
-    def parse_srt(self) -> List[Dict]:
-        """Parse SRT file into structured subtitle blocks."""
-        content = self.read_srt_with_encoding_detection()
-        print(content[:300] + "...")  # Debug: print first 300 chars of content
-        
-        # Remove BOM if present
-        content = content.lstrip('\ufeff')
         
-        # Split by double newlines to get subtitle blocks
-        blocks = re.split(r'\n\s*\n', content.strip())
-        
-        subtitles = []
-        for block in blocks:
-            if not block.strip():
+        with f:
+            while block := f.read(_READ_BLOCK_SIZE):
+                yield decoder.decode(block)
+        yield decoder.decode(b'', final=True)
+    
+    def _iter_lines(self, encoding: str) -> Iterator[str]:
+        """Stream the SRT file's lines without their line endings."""
+        pending = ''
+        for text in self._iter_text(encoding):
+            *lines, pending = (pending + text).split('\n')
+            yield from lines
+        if pending:
+            yield pending
+    
+    def iter_subtitles(self, encoding: Optional[str] = None) -> Iterator[Subtitle]:
+        """Stream subtitle blocks from the SRT file one at a time."""
+        if encoding is None:
+            encoding = self.detect_encoding()
+        
+        lines = []
+        first = True
+        for line in self._iter_lines(encoding):
+            if first:
+                # Remove BOM if present
+                line = line.lstrip('\ufeff')
+                first = False
+            
+            if line.strip():
+                lines.append(line)
                 continue
-                
-            lines = block.strip().split('\n')
-            if len(lines) >= 3:
-                try:
-                    seq_num = int(lines[0].strip())
-                    timing = lines[1].strip()
-                    text = '\n'.join(lines[2:]).strip()
-                    
-                    subtitles.append({
-                        'sequence': seq_num,
-                        'timing': timing,
-                        'text': text,
-                        'original_block': block
-                    })
-                except ValueError:
-                    continue
+            
+            # A blank line ends the current block
+            if lines:
+                subtitle = self._parse_block(lines)
+                if subtitle:
+                    yield subtitle
+                lines = []
+        
+        if lines:
+            subtitle = self._parse_block(lines)
+            if subtitle:
+                yield subtitle
+    
+    @staticmethod
+    def _parse_block(lines: List[str]) -> Optional[Subtitle]:
+        """Parse the lines of one SRT block, or return None if malformed."""
+        if len(lines) < 3:
+            return None
+        try:
+            seq_num = int(lines[0])
+        except ValueError:
+            return None
         
-        self.subtitles = subtitles
-        return subtitles
+        return Subtitle(seq_num, lines[1].strip(), '\n'.join(lines[2:]).strip())
+    
+    def parse_srt(self) -> List[Subtitle]:
+        """Parse SRT file into structured subtitle blocks."""
+        stat = os.stat(self.srt_path)
+        cached = self.load_cached_subtitles(stat)
+        if cached is not None:
+            self.subtitles = cached
+            return self.subtitles
+        
+        encoding = self.detect_encoding()
+        if logger.isEnabledFor(logging.DEBUG):
+            preview = self._iter_text(encoding)
+            logger.debug("preview: %s...", next(preview)[:300])  # First 300 chars of content
+            preview.close()
+        
+        self.subtitles = list(self.iter_subtitles(encoding))
+        self.save_cached_subtitles(stat, self.subtitles)
+        return self.subtitles
+    
+    def _iter_and_cache_subtitles(self, stat: os.stat_result) -> Iterator[Subtitle]:
+        """Stream subtitle blocks, caching them once the file is fully read."""
+        return self._cache_subtitles(stat, self.iter_subtitles())
+    
+    def _cache_header(self, stat: os.stat_result) -> Dict[str, Any]:
+        """First cache record, identifying the exact SRT file the subtitles came from."""
+        return {
+            'version': _SUBTITLE_CACHE_VERSION,
+            'source': os.path.basename(self.srt_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+    
+    @staticmethod
+    def _pack_cache_record(record: Any) -> bytes:
+        """Encode one cache record (msgpack, or one JSON line without it)."""
+        if msgpack is not None:
+            return msgpack.packb(record, use_bin_type=True)
+        return json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+    
+    def load_cached_subtitles(self, stat: os.stat_result) -> Optional[List[Subtitle]]:
+        """Load parsed subtitles cached for this exact SRT file, if present."""
+        cache_path = os.path.join(self.cache_dir, _SUBTITLE_CACHE_NAME)
+        try:
+            with open(cache_path, 'rb') as f:
+                if msgpack is not None:
+                    records = msgpack.Unpacker(f, raw=False)
+                else:
+                    # JSON holds plain data only; a pickle from a movie folder could run code
+                    records = (json.loads(line) for line in f)
+                if next(records, None) != self._cache_header(stat):
+                    return None
+                return [Subtitle._make(record) for record in records]
+        except Exception:
+            # Treat missing or unreadable cache entries as misses
+            return None
+    
+    def save_cached_subtitles(self, stat: os.stat_result, subtitles: Iterable[Subtitle]) -> None:
+        """Store parsed subtitles in the movie's cache (written atomically)."""
+        for _ in self._cache_subtitles(stat, subtitles):
+            pass
+    
+    def _cache_subtitles(self, stat: os.stat_result, subtitles: Iterable[Subtitle]) -> Iterator[Subtitle]:
+        """Pass subtitles through, writing each to the cache as it goes by.
+        
+        Records go to a .tmp sibling that replaces the cache only once every
+        subtitle has been written, so an interrupted run leaves no partial cache.
+        """
+        cache_path = os.path.join(self.cache_dir, _SUBTITLE_CACHE_NAME)
+        tmp_file = cache_path + '.tmp'
+        f = None
+        try:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                f = open(tmp_file, 'wb')
+                f.write(self._pack_cache_record(self._cache_header(stat)))
+            except OSError as e:
+                f = self._abandon_cache(f, tmp_file, e)
+            
+            for subtitle in subtitles:
+                if f is not None:
+                    try:
+                        f.write(self._pack_cache_record(list(subtitle)))
+                    except OSError as e:
+                        f = self._abandon_cache(f, tmp_file, e)
+                yield subtitle
+            
+            if f is not None:
+                try:
+                    f.close()
+                    os.replace(tmp_file, cache_path)
+                    f = None
+                except OSError as e:
+                    f = self._abandon_cache(f, tmp_file, e)
+        finally:
+            if f is not None:
+                # Stopped before the last subtitle; never leave a partial cache behind
+                self._abandon_cache(f, tmp_file)
+    
+    @staticmethod
+    def _abandon_cache(f, tmp_file: str, error: Optional[OSError] = None) -> None:
+        """Give up on writing the cache for this run, removing the partial file."""
+        if error is not None:
+            # The cache is an optimization; never fail the run over it
+            print(f"Warning: Could not write subtitle cache: {error}")
+        try:
+            if f is not None:
+                f.close()
+        except OSError:
+            pass
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
     
     def _find_english_subtitle(self) -> str:
         """Find the English subtitle file in the movie folder."""
-        # Look for files ending with _EN.srt first
-        en_pattern = os.path.join(self.movie_folder, '*_EN.srt')
-        import glob
-        en_files = glob.glob(en_pattern)
-        
-        if en_files:
-            return en_files[0]
-        
-        # Fallback to any .srt file
-        srt_pattern = os.path.join(self.movie_folder, '*.srt')
-        srt_files = glob.glob(srt_pattern)
+        # Prefer files ending with _EN.srt, fall back to any .srt file
+        fallback = None
+        with os.scandir(self.movie_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('.') or not name.endswith('.srt'):
+                    continue
+                if name.endswith('_EN.srt'):
+                    return os.path.join(self.movie_folder, name)
+                if fallback is None:
+                    fallback = os.path.join(self.movie_folder, name)
         
-        if srt_files:
-            return srt_files[0]
+        if fallback:
+            return fallback
         
         raise FileNotFoundError(f"No subtitle file found in {self.movie_folder}")
     
@@ -112,22 +400,26 @@ class SRTProcessor:
         
         return self.metadata
     
-    def generate_story_context(self) -> str:
-        """Generate story context from metadata for translation context."""
-        if not self.metadata:
-            if not os.path.exists(self.metadata_path):
-                # Fallback to basic analysis if no metadata provided
-                return self._generate_basic_context()
+    def _meta(self, *keys: str, default: Any = None) -> Any:
+        """Look up a nested metadata field, loading metadata.json on first use."""
+        if self.metadata is None:
             self.load_metadata()
         
-        meta = self.metadata
+        value = self.metadata
+        for key in keys:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key)
+        return default if value is None else value
+    
+    def generate_story_context(self) -> str:
+        """Generate story context from metadata for translation context."""
+        if self.story_context:
+            return self.story_context
         
-        # Extract information from metadata
-        genre = meta.get('film_metadata', {}).get('genre', 'Unknown')
-        setting = meta.get('film_metadata', {}).get('setting', {})
-        characters = meta.get('characters', {})
-        themes = meta.get('themes', {})
-        translation_context = meta.get('translation_context', {})
+        if not self.metadata and not os.path.exists(self.metadata_path):
+            # Fallback to basic analysis if no metadata provided
+            return self._generate_basic_context()
         
         # Build context string
         context_parts = []
@@ -135,41 +427,46 @@ class SRTProcessor:
         context_parts.append("")
         
         # Basic film info
-        if meta.get('story_summary'):
-            context_parts.append(f"STORY: {meta['story_summary']}")
+        story_summary = self._meta('story_summary')
+        if story_summary:
+            context_parts.append(f"STORY: {story_summary}")
             context_parts.append("")
         
-        context_parts.append(f"GENRE: {genre.title()}")
-        if meta.get('film_metadata', {}).get('subgenres'):
-            subgenres = ', '.join(meta['film_metadata']['subgenres'])
-            context_parts.append(f"SUBGENRES: {subgenres}")
+        genre = self._meta('film_metadata', 'genre', default='Unknown')
+        context_parts.append(_format_genre(genre))
+        subgenres = self._meta('film_metadata', 'subgenres')
+        if subgenres:
+            context_parts.append(_format_joined("SUBGENRES", tuple(subgenres)))
         context_parts.append("")
         
         # Characters
-        main_chars = characters.get('main_characters', [])
+        main_chars = self._meta('characters', 'main_characters')
         if main_chars:
-            context_parts.append(f"MAIN CHARACTERS: {', '.join(main_chars)}")
+            context_parts.append(_format_joined("MAIN CHARACTERS", tuple(main_chars)))
         
-        secondary_chars = characters.get('secondary_characters', [])
+        secondary_chars = self._meta('characters', 'secondary_characters')
         if secondary_chars:
-            context_parts.append(f"SECONDARY CHARACTERS: {', '.join(secondary_chars)}")
+            context_parts.append(_format_joined("SECONDARY CHARACTERS", tuple(secondary_chars)))
         
-        if characters.get('character_relationships'):
-            context_parts.append(f"RELATIONSHIPS: {characters['character_relationships']}")
+        relationships = self._meta('characters', 'character_relationships')
+        if relationships:
+            context_parts.append(f"RELATIONSHIPS: {relationships}")
         context_parts.append("")
         
         # Setting
-        if setting.get('location'):
-            context_parts.append(f"LOCATION: {setting['location']}")
-        if setting.get('time_period'):
-            context_parts.append(f"TIME PERIOD: {setting['time_period']}")
-        if setting.get('environment'):
-            env = ', '.join(setting['environment'])
-            context_parts.append(f"ENVIRONMENTS: {env}")
+        location = self._meta('film_metadata', 'setting', 'location')
+        if location:
+            context_parts.append(f"LOCATION: {location}")
+        time_period = self._meta('film_metadata', 'setting', 'time_period')
+        if time_period:
+            context_parts.append(f"TIME PERIOD: {time_period}")
+        environment = self._meta('film_metadata', 'setting', 'environment')
+        if environment:
+            context_parts.append(_format_joined("ENVIRONMENTS", tuple(environment)))
         context_parts.append("")
         
         # Themes
-        primary_themes = themes.get('primary_themes', [])
+        primary_themes = self._meta('themes', 'primary_themes')
         if primary_themes:
             context_parts.append("THEMES:")
             for theme in primary_themes:
@@ -177,7 +474,7 @@ class SRTProcessor:
             context_parts.append("")
         
         # Cultural elements
-        cultural_elements = themes.get('cultural_elements', [])
+        cultural_elements = self._meta('themes', 'cultural_elements')
         if cultural_elements:
             context_parts.append("KEY CULTURAL ELEMENTS:")
             for element in cultural_elements:
@@ -188,22 +485,22 @@ class SRTProcessor:
         context_parts.append("TRANSLATION NOTES:")
         
         # Add proper nouns to preserve
-        proper_nouns = translation_context.get('special_terminology', {}).get('proper_nouns', [])
+        proper_nouns = self._meta('translation_context', 'special_terminology', 'proper_nouns')
         if proper_nouns:
-            context_parts.append(f"- Preserve these names/terms exactly: {', '.join(proper_nouns)}")
+            context_parts.append(_format_joined("- Preserve these names/terms exactly", tuple(proper_nouns)))
         
         # Add cultural terms
-        cultural_terms = translation_context.get('special_terminology', {}).get('cultural_terms', [])
+        cultural_terms = self._meta('translation_context', 'special_terminology', 'cultural_terms')
         if cultural_terms:
-            context_parts.append(f"- Handle these cultural terms carefully: {', '.join(cultural_terms)}")
+            context_parts.append(_format_joined("- Handle these cultural terms carefully", tuple(cultural_terms)))
         
         # Add register information
-        register = translation_context.get('register', '')
+        register = self._meta('translation_context', 'register')
         if register:
             context_parts.append(f"- Use {register} register/tone in Romanian")
         
         # Add specific translation notes
-        translation_notes = translation_context.get('translation_notes', [])
+        translation_notes = self._meta('translation_context', 'translation_notes', default=[])
         for note in translation_notes:
             context_parts.append(f"- {note}")
         
@@ -219,13 +516,13 @@ class SRTProcessor:
         if not self.subtitles:
             self.parse_srt()
         
-        all_text = ' '.join([sub['text'] for sub in self.subtitles])
-        
-        # Basic character name detection
-        character_mentions = re.findall(r'\b[A-Z][a-z]{2,}\b', all_text)
+        # Basic character name detection, counted per subtitle without joining all text
+        mention_counts = Counter()
+        for sub in self.subtitles:
+            for match in _NAME_RE.finditer(sub.text):
+                mention_counts[match.group()] += 1
         # Filter out common English words
-        common_words = {'The', 'And', 'But', 'You', 'Are', 'Can', 'Was', 'Not', 'Now', 'Get', 'Got', 'Let', 'Put', 'How', 'Why', 'Who', 'What', 'When', 'Where', 'They', 'She', 'Him', 'Her', 'His', 'All', 'One', 'Two', 'Yes', 'Out', 'Off', 'Run', 'Come', 'Take', 'Make', 'Look', 'See', 'Know', 'Think', 'Want', 'Like', 'Time', 'Good', 'Bad', 'Big', 'Old', 'New', 'Right', 'Left', 'Long', 'Last', 'Next', 'First', 'Best', 'Day', 'Night', 'Here', 'There', 'Back', 'Down', 'Over', 'After', 'Before'}
-        common_names = [name for name in set(character_mentions) if character_mentions.count(name) >= 3 and name not in common_words]
+        common_names = [name for name, count in mention_counts.items() if count >= 3 and name not in _COMMON_WORDS]
         
         context = f"""STORY CONTEXT for Translation:
         
@@ -243,33 +540,33 @@ TRANSLATION NOTES:
         self.story_context = context
         return context
     
-    def create_chunks(self, chunk_size: int = 15) -> List[Dict]:
-        """Split subtitles into manageable chunks for translation."""
-        if not self.subtitles:
-            self.parse_srt()
-        
-        chunks = []
-        for i in range(0, len(self.subtitles), chunk_size):
-            chunk_subtitles = self.subtitles[i:i + chunk_size]
-            chunk = {
-                'chunk_id': len(chunks) + 1,
-                'start_sequence': chunk_subtitles[0]['sequence'],
-                'end_sequence': chunk_subtitles[-1]['sequence'],
-                'subtitles': chunk_subtitles,
-                'srt_format': self._format_chunk_as_srt(chunk_subtitles)
-            }
-            chunks.append(chunk)
-        
-        return chunks
-    
-    def _format_chunk_as_srt(self, chunk_subtitles: List[Dict]) -> str:
+    def create_chunks(self, chunk_size: int = 15,
+                      subtitles: Optional[Iterable[Subtitle]] = None) -> Iterator[Dict]:
+        """Split subtitles into manageable chunks for translation, one at a time."""
+        if subtitles is None:
+            # Without parsed subtitles, build chunks straight from the file stream
+            subtitles = self.subtitles if self.subtitles else self.iter_subtitles()
+        
+        for chunk_id, chunk_subtitles in enumerate(_batched(subtitles, chunk_size), 1):
+            yield self._make_chunk(chunk_id, chunk_subtitles)
+    
+    def _make_chunk(self, chunk_id: int, chunk_subtitles: List[Subtitle]) -> Dict:
+        """Build a chunk record from its subtitles."""
+        return {
+            'chunk_id': chunk_id,
+            'start_sequence': chunk_subtitles[0].sequence,
+            'end_sequence': chunk_subtitles[-1].sequence,
+            'subtitles': chunk_subtitles,
+            'srt_format': self._format_chunk_as_srt(chunk_subtitles)
+        }
+    
+    def _format_chunk_as_srt(self, chunk_subtitles: List[Subtitle]) -> str:
         """Format a chunk of subtitles as SRT format for translation."""
-        srt_text = ""
-        for sub in chunk_subtitles:
-            srt_text += f"{sub['sequence']}\n{sub['timing']}\n{sub['text']}\n\n"
-        return srt_text.strip()
+        return '\n\n'.join(
+            f"{sub.sequence}\n{sub.timing}\n{sub.text}" for sub in chunk_subtitles
+        )
     
-    def save_chunks_for_translation(self):
+    def save_chunks_for_translation(self, chunk_size: int = 15) -> Dict[str, int]:
         """Save chunks and context to files for Claude Code translation."""
         
         # Generate story context
@@ -277,8 +574,7 @@ TRANSLATION NOTES:
         
         # Save story context
         context_file = os.path.join(self.chunks_dir, '00_context.txt')
-        with open(context_file, 'w', encoding='utf-8') as f:
-            f.write(story_context)
+        _write_utf8(context_file, story_context)
         
         # Create CLAUDE.md for persistent context
         claude_md_content = f"""# Translation Context for {self.movie_name}
@@ -290,64 +586,55 @@ TRANSLATION NOTES:
 You are an expert English-to-Romanian subtitle translator. The above context provides important information about this film for accurate translation. When translating subtitle chunks, maintain the exact SRT timing format, preserve character names, and follow the cultural guidance provided."""
         
         claude_md_file = os.path.join(self.movie_folder, 'CLAUDE.md')
-        with open(claude_md_file, 'w', encoding='utf-8') as f:
-            f.write(claude_md_content)
+        _write_utf8(claude_md_file, claude_md_content)
         
         # Save translation prompt template (for reference)
-        prompt_template = """You are an expert English-to-Romanian subtitle translator specializing in film dialogue.
-
-TASK: Translate the following English subtitles to Romanian while:
-1. Preserving the exact SRT timing format (XX:XX:XX,XXX --> XX:XX:XX,XXX)
-2. Keeping sequence numbers identical
-3. Maintaining dialogue formatting (dashes, ellipses, etc.)
-4. Preserving character names exactly as shown
-5. Using natural Romanian that matches the emotional tone
-6. Properly translating idioms and cultural references
-7. Maintaining the same line structure where possible
-
-Translate this chunk:
-
-{srt_chunk}
-
-Respond with ONLY the translated SRT format, no additional explanation."""
+        prompt_template = (
+            "You are an expert English-to-Romanian subtitle translator specializing in film dialogue.\n\n"
+            "TASK: " + _PROMPT_PREFIX + "{srt_chunk}" + _PROMPT_SUFFIX
+        )
 
         template_file = os.path.join(self.chunks_dir, 'prompt_template.txt')
-        with open(template_file, 'w', encoding='utf-8') as f:
-            f.write(prompt_template)
-        
-        # Save chunks and generate individual prompts
-        chunks = self.create_chunks()
-        for chunk in chunks:
-            # Save chunk data
-            chunk_filename = os.path.join(self.chunks_dir, f"chunk_{chunk['chunk_id']:02d}.txt")
-            with open(chunk_filename, 'w', encoding='utf-8') as f:
-                f.write(f"CHUNK {chunk['chunk_id']}\n")
-                f.write(f"Sequences {chunk['start_sequence']}-{chunk['end_sequence']}\n")
-                f.write("="*50 + "\n\n")
-                f.write(chunk['srt_format'])
-            
-            # Generate individual translation prompt
-            individual_prompt = f"""Translate the following English subtitles to Romanian while:
-1. Preserving the exact SRT timing format (XX:XX:XX,XXX --> XX:XX:XX,XXX)
-2. Keeping sequence numbers identical
-3. Maintaining dialogue formatting (dashes, ellipses, etc.)
-4. Preserving character names exactly as shown
-5. Using natural Romanian that matches the emotional tone
-6. Properly translating idioms and cultural references
-7. Maintaining the same line structure where possible
-
-Translate this chunk:
-
-{chunk['srt_format']}
-
-Respond with ONLY the translated SRT format, no additional explanation."""
+        _write_utf8(template_file, prompt_template)
+        
+        # Parse, chunk and write in a single streaming pass; file writes are
+        # handed to a thread pool so they overlap with parsing the next chunk
+        subtitles = self.subtitles
+        if not subtitles:
+            stat = os.stat(self.srt_path)
+            subtitles = self.load_cached_subtitles(stat) or self._iter_and_cache_subtitles(stat)
+        prompt_prefix = _PROMPT_PREFIX.encode('utf-8')
+        prompt_suffix = _PROMPT_SUFFIX.encode('utf-8')
+        chunk_count = 0
+        subtitle_count = 0
+        writes = []
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            for chunk in self.create_chunks(chunk_size, subtitles):
+                chunk_id = chunk['chunk_id']
+                srt_format = chunk['srt_format'].encode('utf-8')
+                
+                # Save chunk data
+                chunk_filename = os.path.join(self.chunks_dir, f"chunk_{chunk_id:02d}.txt")
+                header = (
+                    f"CHUNK {chunk_id}\n"
+                    f"Sequences {chunk['start_sequence']}-{chunk['end_sequence']}\n"
+                    + "="*50 + "\n\n"
+                ).encode('utf-8')
+                writes.append(executor.submit(Path(chunk_filename).write_bytes, header + srt_format))
+                
+                # Save individual prompt file around the constant prompt text
+                prompt_filename = os.path.join(self.prompts_dir, f"prompt_chunk_{chunk_id:02d}.txt")
+                prompt = b''.join((prompt_prefix, srt_format, prompt_suffix))
+                writes.append(executor.submit(Path(prompt_filename).write_bytes, prompt))
+                
+                chunk_count = chunk_id
+                subtitle_count += len(chunk['subtitles'])
             
-            # Save individual prompt file
-            prompt_filename = os.path.join(self.prompts_dir, f"prompt_chunk_{chunk['chunk_id']:02d}.txt")
-            with open(prompt_filename, 'w', encoding='utf-8') as f:
-                f.write(individual_prompt)
+            # Surface the first write error, if any
+            for future in writes:
+                future.result()
         
-        return chunks
+        return {'chunks': chunk_count, 'subtitles': subtitle_count}
 
 def main():
     """Main function to process movie folder."""
@@ -385,11 +672,9 @@ def main():
             print("WARNING: No metadata.json found. Using basic analysis.")
             print("For better results, create metadata.json using analyze_subtitles_prompt.md")
         
-        subtitles = processor.parse_srt()
-        print(f"Found {len(subtitles)} subtitle entries")
-        
-        chunks = processor.save_chunks_for_translation()
-        print(f"Created {len(chunks)} translation chunks in /chunks")
+        summary = processor.save_chunks_for_translation()
+        print(f"Found {summary['subtitles']} subtitle entries")
+        print(f"Created {summary['chunks']} translation chunks in /chunks")
         
         print("\nNext steps:")
         print(f"AUTOMATED: python tools/translate_batch.py movies/{processor.movie_name} translate")
@@ -6,8 +6,43 @@ Combines translated chunks back into a complete Romanian SRT file.
 
 import os
 import re
-import glob
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+_TIMING_RE = re.compile(r'\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}')
+
+# Blocks are separated by a newline, optional whitespace, and a newline. Plain
+# '\n\n' splitting only differs when whitespace sits between the two newlines
+_BLOCK_SEPARATOR_RE = re.compile(r'\n\s*\n')
+_SPACED_SEPARATOR_RE = re.compile(r'\n[^\S\n]+\n')
+
+def _valid_timing(timing: str) -> bool:
+    """Check an SRT timing line, using fixed offsets before falling back to the regex."""
+    # HH:MM:SS,mmm --> HH:MM:SS,mmm has every separator at a fixed position
+    if (len(timing) >= 29
+            and timing[2] == timing[5] == timing[19] == timing[22] == ':'
+            and timing[8] == timing[25] == ','
+            and timing[12:17] == ' --> '):
+        digits = (timing[0:2] + timing[3:5] + timing[6:8] + timing[9:12]
+                  + timing[17:19] + timing[20:22] + timing[23:25] + timing[26:29])
+        if digits.isascii() and digits.isdigit():
+            return True
+    # Rare shapes, e.g. non-ASCII digits, get the exact regex verdict
+    return _TIMING_RE.match(timing) is not None
+
+def _write_utf8(path: str, text: str) -> None:
+    """Write text as UTF-8 in one binary write, skipping the text-mode encoder."""
+    Path(path).write_bytes(text.encode('utf-8'))
+
+def _split_srt_blocks(content: str) -> List[str]:
+    """Split SRT content into blocks separated by blank or whitespace-only lines."""
+    if _SPACED_SEPARATOR_RE.search(content):
+        # Rare shapes, e.g. CRLF line ends or blank lines holding spaces, get the exact regex split
+        parts = _BLOCK_SEPARATOR_RE.split(content)
+    else:
+        # One C-level split on the separator instead of a regex or a Python scan loop
+        parts = content.split('\n\n')
+    return [block for block in (part.strip() for part in parts) if block]
 
 class TranslationAssembler:
     def __init__(self, movie_folder: str):
@@ -22,22 +57,30 @@ class TranslationAssembler:
         if not os.path.exists(self.translated_chunks_dir):
             raise FileNotFoundError(f"Translated chunks directory '{self.translated_chunks_dir}' not found")
         
-        # Find all translated chunk files
-        chunk_pattern = os.path.join(self.translated_chunks_dir, "chunk_*_RO.txt")
-        chunk_files = glob.glob(chunk_pattern)
-        
-        if not chunk_files:
+        # Find all translated chunk files in one directory pass
+        numbered_files = []
+        with os.scandir(self.translated_chunks_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('chunk_') and name.endswith('_RO.txt'):
+                    try:
+                        chunk_num = int(name[6:-7])
+                    except ValueError:
+                        continue
+                    numbered_files.append((chunk_num, entry.path))
+        
+        if not numbered_files:
             raise FileNotFoundError(f"No translated chunk files found in '{self.translated_chunks_dir}'\nExpected pattern: chunk_XX_RO.txt")
         
         # Sort files by chunk number
-        chunk_files.sort(key=lambda x: int(re.search(r'chunk_(\d+)_RO', x).group(1)))
+        numbered_files.sort()
         
         chunks = []
-        for chunk_file in chunk_files:
-            chunk_num = int(re.search(r'chunk_(\d+)_RO', chunk_file).group(1))
-            
-            with open(chunk_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+        for chunk_num, chunk_file in numbered_files:
+            # Small files: one bytes read and decode beats a text-mode reader; newlines
+            # are normalized the way text mode would (chunks saved on Windows use CRLF)
+            content = Path(chunk_file).read_bytes().decode('utf-8')
+            content = content.replace('\r\n', '\n').replace('\r', '\n').strip()
             
             chunks.append({
                 'chunk_number': chunk_num,
@@ -52,20 +95,19 @@ class TranslationAssembler:
         # Remove BOM if present
         srt_text = srt_text.lstrip('\ufeff')
         
-        # Split by double newlines to get subtitle blocks
-        blocks = re.split(r'\n\s*\n', srt_text.strip())
+        # Split by blank lines to get subtitle blocks
+        blocks = _split_srt_blocks(srt_text)
         
         subtitles = []
         for block in blocks:
-            if not block.strip():
-                continue
-                
-            lines = block.strip().split('\n')
-            if len(lines) >= 3:
+            # Sequence number, timing, then text: slice at the first two newlines
+            nl1 = block.find('\n')
+            nl2 = block.find('\n', nl1 + 1) if nl1 != -1 else -1
+            if nl2 != -1:
                 try:
-                    seq_num = int(lines[0].strip())
-                    timing = lines[1].strip()
-                    text = '\n'.join(lines[2:]).strip()
+                    seq_num = int(block[:nl1])
+                    timing = block[nl1 + 1:nl2].strip()
+                    text = block[nl2 + 1:].strip()
                     
                     subtitles.append({
                         'sequence': seq_num,
@@ -78,8 +120,8 @@ class TranslationAssembler:
         
         return subtitles
     
-    def validate_translation(self, chunks: List[Dict]) -> bool:
-        """Validate that translation maintains proper SRT structure."""
+    def validate_translation(self, chunks: List[Dict]) -> Tuple[bool, List[Dict]]:
+        """Validate that translation maintains proper SRT structure, returning (ok, subtitles)."""
         all_subtitles = []
         
         for chunk in chunks:
@@ -88,7 +130,7 @@ class TranslationAssembler:
         
         if not all_subtitles:
             print("Error: No valid subtitles found in translated chunks")
-            return False
+            return False, all_subtitles
         
         # Check sequence numbering
         expected_seq = 1
@@ -98,13 +140,12 @@ class TranslationAssembler:
             expected_seq = sub['sequence'] + 1
         
         # Check timing format
-        timing_pattern = r'\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}'
         for sub in all_subtitles:
-            if not re.match(timing_pattern, sub['timing']):
+            if not _valid_timing(sub['timing']):
                 print(f"Warning: Invalid timing format in sequence {sub['sequence']}: {sub['timing']}")
         
         print(f"Validation complete: {len(all_subtitles)} subtitles found")
-        return True
+        return True, all_subtitles
     
     def assemble_final_srt(self, output_file: Optional[str] = None) -> str:
         """Assemble all translated chunks into final Romanian SRT file."""
@@ -118,27 +159,19 @@ class TranslationAssembler:
         
         print(f"Found {len(chunks)} translated chunks")
         
-        # Validate before assembly
-        if not self.validate_translation(chunks):
+        # Validate before assembly, reusing its parsed subtitles
+        valid, all_subtitles = self.validate_translation(chunks)
+        if not valid:
             print("Warning: Validation found issues, but proceeding with assembly")
         
-        # Combine all chunks
-        all_subtitles = []
-        for chunk in chunks:
-            chunk_subtitles = self.parse_srt_content(chunk['content'])
-            all_subtitles.extend(chunk_subtitles)
-        
-        # Sort by sequence number to ensure proper order
-        all_subtitles.sort(key=lambda x: x['sequence'])
-        
-        # Generate final SRT content
-        final_srt = ""
-        for sub in all_subtitles:
-            final_srt += f"{sub['sequence']}\n{sub['timing']}\n{sub['text']}\n\n"
+        # Sort by sequence number to ensure proper order, unless already ordered
+        if any(prev['sequence'] > sub['sequence'] for prev, sub in zip(all_subtitles, all_subtitles[1:])):
+            all_subtitles.sort(key=lambda x: x['sequence'])
         
-        # Write to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_srt)
+        # Encode the final SRT content once and write it in a single call
+        _write_utf8(output_file, ''.join(
+            f"{sub['sequence']}\n{sub['timing']}\n{sub['text']}\n\n" for sub in all_subtitles
+        ))
         
         print(f"Final Romanian subtitle file created: {output_file}")
         print(f"Total subtitles: {len(all_subtitles)}")
@@ -153,9 +186,11 @@ class TranslationAssembler:
             return "No translated chunks found yet."
         
         # Count expected vs actual chunks
-        original_chunks_pattern = os.path.join(self.chunks_dir, "chunk_*.txt")
-        original_chunk_files = glob.glob(original_chunks_pattern)
-        expected_chunks = len(original_chunk_files)
+        with os.scandir(self.chunks_dir) as entries:
+            expected_chunks = sum(
+                1 for entry in entries
+                if entry.name.startswith('chunk_') and entry.name.endswith('.txt')
+            )
         
         report = f"""TRANSLATION PROGRESS REPORT
 ===========================
@@ -165,14 +200,15 @@ Progress: {len(chunks)}/{expected_chunks} ({len(chunks)/expected_chunks*100:.1f}
 
 Completed chunks:
 """
+        report_lines = [report]
         for chunk in chunks:
-            report += f"  ✓ Chunk {chunk['chunk_number']}\n"
+            report_lines.append(f"  ✓ Chunk {chunk['chunk_number']}\n")
         
         if len(chunks) < expected_chunks:
             missing_nums = set(range(1, expected_chunks + 1)) - set(chunk['chunk_number'] for chunk in chunks)
-            report += f"\nMissing chunks: {sorted(missing_nums)}\n"
+            report_lines.append(f"\nMissing chunks: {sorted(missing_nums)}\n")
         
-        return report
+        return ''.join(report_lines)
 
 def main():
     """Main function to reassemble translated subtitles."""
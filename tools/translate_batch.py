@@ -6,11 +6,135 @@ Processes all translation prompts through Claude Code automatically.
 
 import os
 import sys
+import asyncio
+import queue
+import logging
+import logging.handlers
 import subprocess
-import glob
 import argparse
-from typing import List
+import threading
+import concurrent.futures
+from functools import cached_property
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
 import time
+import random
+
+try:
+    import anthropic
+except ImportError:  # Optional dependency, only needed for --backend sdk and --use-batch-api
+    anthropic = None
+
+from claude_session import ClaudeSession
+
+logger = logging.getLogger(__name__)
+
+# Claude Code calls run in parallel by default
+DEFAULT_CONCURRENCY = 5
+
+# Retries of transient Claude Code failures (--max-retries)
+DEFAULT_MAX_RETRIES = 3
+RETRY_MAX_DELAY = 60
+RETRYABLE_ERRORS = ('rate_limit', 'rate limit', 'overloaded', '529', 'timeout', 'timed out',
+                    'econnreset', 'connection error')
+
+# Anthropic API settings (--backend sdk and --use-batch-api)
+DEFAULT_API_MODEL = "claude-sonnet-4-5"
+API_MAX_TOKENS = 8192
+BATCH_POLL_MIN_SECONDS = 10
+BATCH_POLL_MAX_SECONDS = 300
+BATCH_ID_FILE = '.batch_id'
+
+def _write_translation(output_file: str, text: str) -> None:
+    """Write a translation atomically via a .tmp sibling and os.replace."""
+    tmp_file = output_file + '.tmp'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+def _start_logging(quiet: bool = False) -> logging.handlers.QueueListener:
+    """Route log records through a queue to one background thread writing to stdout."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Worker threads only enqueue records, so lines never interleave mid-write
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    logger.propagate = False
+    
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+def _ensure_logging() -> None:
+    """Print progress to stdout when used as a library and nothing else handles our records."""
+    # main() installs the queue handler; callers with their own logging setup keep it
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+
+def _response_text(message) -> Optional[str]:
+    """Text of a complete API response, or None if the model stopped early (e.g. max_tokens)."""
+    if message.stop_reason != 'end_turn':
+        return None
+    return ''.join(block.text for block in message.content if block.type == 'text')
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so parallel workers don't retry in lockstep."""
+    return min(RETRY_MAX_DELAY, 2 ** attempt + random.uniform(0, 1))
+
+def _default_backend() -> str:
+    """Use the Anthropic API directly when it is installed and configured."""
+    if anthropic is not None and os.environ.get('ANTHROPIC_API_KEY'):
+        return 'sdk'
+    return 'cli'
+
+def _is_retryable_api_error(error: Exception) -> bool:
+    """Whether an Anthropic API error is transient (rate limit, overload, connection)."""
+    if anthropic is None:
+        return False
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+def _is_rejected_request(error: Exception) -> bool:
+    """Whether the API refused a request outright (rate limit, overload), so nothing was created."""
+    return isinstance(error, anthropic.APIStatusError) and error.status_code in (429, 529)
+
+def _call_with_retries(call, description: str, max_retries: int,
+                       retryable=_is_retryable_api_error):
+    """Make a synchronous Anthropic API call, retrying transient errors with backoff."""
+    for attempt in range(max_retries + 1):
+        try:
+            return call()
+        except Exception as e:
+            if attempt == max_retries or not retryable(e):
+                raise
+            delay = _retry_delay(attempt + 1)
+            logger.warning("↻ Retrying %s in %.0fs (attempt %d/%d): %s",
+                           description, delay, attempt + 2, max_retries + 1, e)
+            time.sleep(delay)
+
+@dataclass(slots=True)
+class WorkItem:
+    """A chunk still to translate, with its prompt already read from disk."""
+    chunk_num: int
+    output_path: str
+    prompt: str
+    prompt_file: str
 
 class BatchTranslator:
     def __init__(self, movie_folder: str):
@@ -20,138 +144,479 @@ class BatchTranslator:
         self.translated_dir = os.path.join(movie_folder, 'translated')
         self.claude_md_path = os.path.join(movie_folder, 'CLAUDE.md')
         
+        # Output path per chunk number; braces in the folder path are escaped for format()
+        escaped_dir = self.translated_dir.replace('{', '{{').replace('}', '}}')
+        self._out_template = os.path.join(escaped_dir, "chunk_{:02d}_RO.txt")
+        
+        # Per-thread Claude Code sessions (with --reuse-session)
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._unclaimed = 0  # chunks of the current run no worker has picked up yet
+        
+        # File contents read once per run
+        self._claude_md = None
+        self._prompts = {}
+        
+        # Async Anthropic API client and model (with --backend sdk)
+        self._client = None
+        self._model = DEFAULT_API_MODEL
+        
         # Create translated directory if it doesn't exist
         os.makedirs(self.translated_dir, exist_ok=True)
     
-    def get_prompt_files(self) -> List[str]:
-        """Get all prompt files in order."""
+    @property
+    def claude_md(self) -> str:
+        """Content of the movie's CLAUDE.md ('' if missing), read on first use."""
+        if self._claude_md is None:
+            try:
+                with open(self.claude_md_path, 'r', encoding='utf-8') as f:
+                    self._claude_md = f.read()
+            except FileNotFoundError:
+                self._claude_md = ""
+        return self._claude_md
+    
+    def read_prompt(self, prompt_file: str) -> str:
+        """Read a prompt file, keeping its content for retries and later calls."""
+        prompt = self._prompts.get(prompt_file)
+        if prompt is None:
+            with open(prompt_file, 'r', encoding='utf-8') as f:
+                prompt = f.read()
+            self._prompts[prompt_file] = prompt
+        return prompt
+    
+    @cached_property
+    def prompt_files(self) -> List[str]:
+        """All prompt files in order, scanned on first use (prompts are written once by prep)."""
         if not os.path.exists(self.prompts_dir):
             raise FileNotFoundError(f"Translation prompts directory not found: {self.prompts_dir}")
         
-        prompt_pattern = os.path.join(self.prompts_dir, "prompt_chunk_*.txt")
-        prompt_files = glob.glob(prompt_pattern)
+        with os.scandir(self.prompts_dir) as entries:
+            prompt_files = [entry.path for entry in entries if self.extract_chunk_number(entry.name)]
         
         if not prompt_files:
             raise FileNotFoundError(f"No prompt files found in {self.prompts_dir}")
         
         # Sort by chunk number
-        prompt_files.sort(key=lambda x: int(x.split('_chunk_')[1].split('.')[0]))
+        prompt_files.sort(key=self.extract_chunk_number)
         return prompt_files
     
-    def get_existing_translations(self) -> List[str]:
-        """Get list of existing translation files."""
-        translation_pattern = os.path.join(self.translated_dir, "chunk_*_RO.txt")
-        return glob.glob(translation_pattern)
+    def get_existing_chunk_numbers(self) -> Set[int]:
+        """Get chunk numbers of existing translations straight from the directory scan."""
+        chunk_numbers = set()
+        with os.scandir(self.translated_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # Fixed filename template: chunk_NN_RO.txt
+                if (name.startswith('chunk_') and name.endswith('_RO.txt') and name[6:-7].isdigit()
+                        and entry.stat().st_size > 0):
+                    chunk_numbers.add(int(name[6:-7]))
+        return chunk_numbers
     
     def extract_chunk_number(self, filepath: str) -> int:
-        """Extract chunk number from filename."""
-        if 'prompt_chunk_' in filepath:
-            return int(filepath.split('prompt_chunk_')[1].split('.')[0])
-        elif 'chunk_' in filepath and '_RO.txt' in filepath:
-            return int(filepath.split('chunk_')[1].split('_RO.txt')[0])
-        return 0
-    
-    def translate_chunk(self, prompt_file: str, output_file: str, claude_code_cmd: str = "claude-code") -> bool:
-        """Translate a single chunk using Claude Code."""
+        """Extract chunk number from filename (0 if it is not a chunk file)."""
+        name = os.path.basename(filepath)
+        # Fixed filename templates: prompt_chunk_NN.txt and chunk_NN_RO.txt
+        if name.startswith('prompt_chunk_') and name.endswith('.txt'):
+            digits = name[13:-4]
+        elif name.startswith('chunk_') and name.endswith('_RO.txt'):
+            digits = name[6:-7]
+        else:
+            return 0
+        return int(digits) if digits.isdigit() else 0
+    
+    def _thread_session(self, claude_code_cmd: str) -> ClaudeSession:
+        """Return this worker thread's Claude Code session, starting one if needed."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = ClaudeSession(claude_code_cmd, cwd=self.movie_folder)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def close_sessions(self) -> None:
+        """Stop every Claude Code session started by worker threads."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+    
+    def _run_claude_to_file(self, claude_code_cmd: str, prompt_content: str,
+                            output_file: str) -> subprocess.CompletedProcess:
+        """Run Claude Code on one prompt, streaming its stdout into output_file atomically."""
+        # Written next to the target and renamed only once complete, so an
+        # interrupted run never leaves a partial translation that resume would skip
+        tmp_file = output_file + '.tmp'
         try:
-            print(f"Translating {os.path.basename(prompt_file)}...")
-            
-            # Read the prompt content
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                prompt_content = f.read()
-            
-            # Convert output_file to absolute path before changing directories
-            output_file = os.path.abspath(output_file)
-            
-            # Change to movie directory so Claude Code can read CLAUDE.md
-            original_dir = os.getcwd()
-            os.chdir(self.movie_folder)
-            
-            try:
-                # Execute Claude Code with the prompt
-                result = subprocess.run(
+            with open(tmp_file, 'w', encoding='utf-8') as out:
+                # Run in the movie directory so Claude Code can read CLAUDE.md;
+                # cwd= leaves this process's directory alone, so chunks can run in parallel
+                proc = subprocess.Popen(
                     [claude_code_cmd],
-                    input=prompt_content,
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    capture_output=True,
-                    timeout=300  # 5 minutes timeout
+                    encoding='utf-8',
+                    cwd=self.movie_folder
                 )
-                
+                try:
+                    _, stderr = proc.communicate(prompt_content, timeout=300)  # 5 minutes timeout
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.communicate()
+                    raise
+                if proc.returncode == 0:
+                    out.flush()
+                    os.fsync(out.fileno())
+            
+            stdout = None
+            if proc.returncode == 0:
+                os.replace(tmp_file, output_file)
+            else:
+                # Claude Code reports some API errors on stdout; keep them for the caller
+                with open(tmp_file, 'r', encoding='utf-8', errors='replace') as f:
+                    stdout = f.read()
+                os.remove(tmp_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout=stdout, stderr=stderr)
+    
+    async def _translate_via_sdk(self, prompt_content: str) -> str:
+        """Translate one prompt with a direct Anthropic API call, CLAUDE.md as system prompt.
+        
+        Raises ValueError if the response was cut short, so nothing partial is saved.
+        """
+        params = {
+            'model': self._model,
+            'max_tokens': API_MAX_TOKENS,
+            'messages': [{'role': 'user', 'content': prompt_content}]
+        }
+        if self.claude_md:
+            params['system'] = self.claude_md
+        response = await self._client.messages.create(**params)
+        translation = _response_text(response)
+        if translation is None:
+            raise ValueError(f"response stopped early ({response.stop_reason}), not saved")
+        return translation
+    
+    def _translate_once(self, item: WorkItem, claude_code_cmd: str,
+                        reuse_session: bool) -> Tuple[bool, bool]:
+        """Make one translation attempt, returning (succeeded, worth_retrying)."""
+        try:
+            if reuse_session:
+                # Hand the prompt to this thread's waiting Claude Code process; another
+                # is only started ahead while chunks remain for the workers to pick up
+                result = self._thread_session(claude_code_cmd).run(item.prompt, timeout=300,
+                                                                   prestart=self._unclaimed > 0)
                 if result.returncode == 0:
-                    # Save the translation (now using absolute path)
-                    with open(output_file, 'w', encoding='utf-8') as f:
-                        f.write(result.stdout)
-                    
-                    print(f"✓ Saved translation to {os.path.basename(output_file)}")
-                    return True
-                else:
-                    print(f"✗ Claude Code error: {result.stderr}")
-                    return False
-                    
-            finally:
-                os.chdir(original_dir)
+                    # Save the translation; paths stay relative to our own cwd
+                    _write_translation(item.output_path, result.stdout)
+            else:
+                result = self._run_claude_to_file(claude_code_cmd, item.prompt, item.output_path)
+            
+            if result.returncode == 0:
+                logger.info("✓ Saved translation to %s", os.path.basename(item.output_path))
+                return True, False
+            else:
+                logger.error("✗ Claude Code error: %s", result.stderr or result.stdout)
+                error_text = f"{result.stderr}\n{result.stdout}".lower()
+                return False, any(marker in error_text for marker in RETRYABLE_ERRORS)
                 
         except subprocess.TimeoutExpired:
-            print(f"✗ Timeout translating {os.path.basename(prompt_file)}")
-            return False
+            logger.error("✗ Timeout translating %s", os.path.basename(item.prompt_file))
+            return False, True
         except Exception as e:
-            print(f"✗ Error translating {os.path.basename(prompt_file)}: {e}")
-            return False
+            logger.error("✗ Error translating %s: %s", os.path.basename(item.prompt_file), e)
+            return False, False
     
-    def translate_all(self, claude_code_cmd: str = "claude-code", resume: bool = True) -> int:
-        """Translate all chunks."""
-        if not os.path.exists(self.claude_md_path):
-            print(f"Warning: CLAUDE.md not found at {self.claude_md_path}")
-            print("Context may not be available. Run prep_translation.py first.")
+    def translate_chunk(self, item: WorkItem, claude_code_cmd: str = "claude-code",
+                        reuse_session: bool = False, max_retries: int = DEFAULT_MAX_RETRIES) -> bool:
+        """Translate a single chunk using Claude Code, retrying transient failures."""
+        logger.info("Translating %s...", os.path.basename(item.prompt_file))
+        with self._sessions_lock:
+            self._unclaimed = max(0, self._unclaimed - 1)
+        
+        for attempt in range(max_retries + 1):
+            if attempt:
+                delay = _retry_delay(attempt)
+                logger.warning("↻ Retrying %s in %.0fs (attempt %d/%d)",
+                               os.path.basename(item.prompt_file), delay, attempt + 1, max_retries + 1)
+                time.sleep(delay)
+            
+            succeeded, worth_retrying = self._translate_once(item, claude_code_cmd, reuse_session)
+            if succeeded:
+                return True
+            if not worth_retrying:
+                return False
+        
+        return False
+    
+    async def _translate_chunk_async(self, item: WorkItem,
+                                     max_retries: int = DEFAULT_MAX_RETRIES) -> bool:
+        """Translate a single chunk through the Anthropic API, retrying transient failures."""
+        logger.info("Translating %s...", os.path.basename(item.prompt_file))
         
-        prompt_files = self.get_prompt_files()
-        existing_translations = self.get_existing_translations() if resume else []
+        for attempt in range(max_retries + 1):
+            if attempt:
+                delay = _retry_delay(attempt)
+                logger.warning("↻ Retrying %s in %.0fs (attempt %d/%d)",
+                               os.path.basename(item.prompt_file), delay, attempt + 1, max_retries + 1)
+                await asyncio.sleep(delay)
+            
+            try:
+                _write_translation(item.output_path, await self._translate_via_sdk(item.prompt))
+                logger.info("✓ Saved translation to %s", os.path.basename(item.output_path))
+                return True
+            except Exception as e:
+                logger.error("✗ Error translating %s: %s", os.path.basename(item.prompt_file), e)
+                if not _is_retryable_api_error(e):
+                    return False
+        
+        return False
+    
+    def plan_work(self, resume: bool = True) -> Tuple[List[WorkItem], int]:
+        """Scan prompts and translations, returning the chunks to translate and the skipped count."""
+        if not os.path.exists(self.claude_md_path):
+            logger.warning("Warning: CLAUDE.md not found at %s", self.claude_md_path)
+            logger.warning("Context may not be available. Run prep_translation.py first.")
         
-        # Get chunk numbers of existing translations
-        existing_chunks = {self.extract_chunk_number(f) for f in existing_translations}
+        prompt_files = self.prompt_files
+        existing_chunks = self.get_existing_chunk_numbers() if resume else set()
         
         total_chunks = len(prompt_files)
         completed = len(existing_chunks)
         
-        print(f"Found {total_chunks} chunks to translate")
+        logger.info("Found %d chunks to translate", total_chunks)
         if resume and existing_chunks:
-            print(f"Resuming: {completed} chunks already completed")
+            logger.info("Resuming: %d chunks already completed", completed)
         
-        successful = 0
+        skipped = 0
+        items = []
         
         for prompt_file in prompt_files:
             chunk_num = self.extract_chunk_number(prompt_file)
-            output_file = os.path.join(self.translated_dir, f"chunk_{chunk_num:02d}_RO.txt")
             
             # Skip if already translated and resuming
             if resume and chunk_num in existing_chunks:
-                print(f"⏭  Skipping chunk {chunk_num:02d} (already translated)")
-                successful += 1
+                logger.info("⏭  Skipping chunk %02d (already translated)", chunk_num)
+                skipped += 1
                 continue
             
-            if self.translate_chunk(prompt_file, output_file, claude_code_cmd):
+            # Read every prompt now, so executing is network and subprocess work only
+            items.append(WorkItem(
+                chunk_num=chunk_num,
+                output_path=self._out_template.format(chunk_num),
+                prompt=self.read_prompt(prompt_file),
+                prompt_file=prompt_file
+            ))
+        
+        return items, skipped
+    
+    def execute_work(self, items: List[WorkItem], claude_code_cmd: str = "claude-code",
+                     concurrency: int = DEFAULT_CONCURRENCY, reuse_session: bool = False,
+                     max_retries: int = DEFAULT_MAX_RETRIES) -> int:
+        """Translate planned chunks with up to concurrency Claude Code calls at once, returning successes."""
+        successful = 0
+        self._unclaimed = len(items)
+        
+        # Each chunk is an independent Claude Code call that mostly waits on the network
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                futures = {
+                    executor.submit(self.translate_chunk, item, claude_code_cmd,
+                                    reuse_session, max_retries): item.chunk_num
+                    for item in items
+                }
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        if future.result():
+                            successful += 1
+                        else:
+                            logger.error("Failed to translate chunk %02d", futures[future])
+                            # Continue with the other chunks instead of stopping
+                except KeyboardInterrupt:
+                    # Don't start queued chunks; in-flight ones finish or clean up their .tmp
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            self.close_sessions()
+        
+        return successful
+    
+    async def execute_work_async(self, items: List[WorkItem], concurrency: int = DEFAULT_CONCURRENCY,
+                                 max_retries: int = DEFAULT_MAX_RETRIES,
+                                 model: str = DEFAULT_API_MODEL) -> int:
+        """Translate planned chunks through the Anthropic API, up to concurrency requests at once."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def translate_one(item: WorkItem) -> bool:
+            async with semaphore:
+                return await self._translate_chunk_async(item, max_retries)
+        
+        # One client for every request, so its pooled keep-alive connections are reused;
+        # retries are left to _translate_chunk_async so --max-retries and its backoff apply
+        self._client = anthropic.AsyncAnthropic(max_retries=0)
+        self._model = model
+        try:
+            results = await asyncio.gather(*(translate_one(item) for item in items),
+                                           return_exceptions=True)
+        finally:
+            await self._client.close()
+            self._client = None
+        
+        successful = 0
+        for item, result in zip(items, results):
+            if result is True:
                 successful += 1
             else:
-                print(f"Failed to translate chunk {chunk_num:02d}")
-                # Continue with next chunk instead of stopping
+                if isinstance(result, BaseException):
+                    logger.error("✗ Error translating chunk %02d: %s", item.chunk_num, result)
+                logger.error("Failed to translate chunk %02d", item.chunk_num)
+        
+        return successful
+    
+    def execute_work_batch(self, items: List[WorkItem], model: str = DEFAULT_API_MODEL,
+                           resume: bool = True, max_retries: int = DEFAULT_MAX_RETRIES) -> int:
+        """Translate planned chunks in one Anthropic Message Batches API submission, returning successes."""
+        if not items:
+            return 0
+        
+        output_files = {f"chunk_{item.chunk_num:02d}": item.output_path for item in items}
+        # Retried here instead of inside the SDK, so --max-retries and its backoff apply
+        client = anthropic.Anthropic(max_retries=0)
+        batch_id_path = os.path.join(self.translated_dir, BATCH_ID_FILE)
+        
+        # A batch submitted by an interrupted run is polled again instead of paid for twice
+        batch = None
+        if resume and os.path.exists(batch_id_path):
+            with open(batch_id_path, 'r', encoding='utf-8') as f:
+                batch_id = f.read().strip()
+            try:
+                batch = _call_with_retries(lambda: client.messages.batches.retrieve(batch_id),
+                                           f"batch {batch_id}", max_retries)
+                logger.info("Resuming batch %s (%s)", batch.id, batch.processing_status)
+            except anthropic.APIStatusError as e:
+                logger.warning("Warning: Could not resume batch %s, submitting a new one: %s", batch_id, e)
+        
+        if batch is None:
+            # CLAUDE.md is sent as the system prompt instead of being found via the working directory
+            system_prompt = self.claude_md
+            
+            requests = []
+            for item in items:
+                params = {
+                    'model': model,
+                    'max_tokens': API_MAX_TOKENS,
+                    'messages': [{'role': 'user', 'content': item.prompt}]
+                }
+                if system_prompt:
+                    params['system'] = system_prompt
+                requests.append({'custom_id': f"chunk_{item.chunk_num:02d}", 'params': params})
+            
+            # Only retried when refused outright: after a dropped connection the
+            # batch may exist already, and a retry would pay for it twice
+            batch = _call_with_retries(lambda: client.messages.batches.create(requests=requests),
+                                       "batch submission", max_retries, retryable=_is_rejected_request)
+            # Saved before polling, so an interrupted run can pick the batch up again
+            _write_translation(batch_id_path, batch.id)
+            logger.info("Submitted batch %s with %d chunks", batch.id, len(requests))
+        
+        # Batches can take a while; poll with exponential backoff
+        delay = BATCH_POLL_MIN_SECONDS
+        while batch.processing_status != 'ended':
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            batch = _call_with_retries(lambda: client.messages.batches.retrieve(batch.id),
+                                       f"batch {batch.id}", max_retries)
+            counts = batch.request_counts
+            logger.info("Batch %s: %s (%d succeeded, %d processing)",
+                        batch.id, batch.processing_status, counts.succeeded, counts.processing)
+        
+        successful = 0
+        results = _call_with_retries(lambda: client.messages.batches.results(batch.id),
+                                     f"batch {batch.id} results", max_retries)
+        for entry in results:
+            output_file = output_files.get(entry.custom_id)
+            if output_file is None:
+                continue
+            
+            if entry.result.type != 'succeeded':
+                logger.error("✗ Batch request %s %s", entry.custom_id, entry.result.type)
+                continue
+            
+            translation = _response_text(entry.result.message)
+            if translation is None:
+                logger.error("✗ Batch request %s stopped early (%s), not saved",
+                             entry.custom_id, entry.result.message.stop_reason)
+                continue
+            _write_translation(output_file, translation)
+            
+            logger.info("✓ Saved translation to %s", os.path.basename(output_file))
+            successful += 1
         
-        print(f"\nTranslation complete: {successful}/{total_chunks} chunks successful")
+        # Every result is handled; missing chunks go into a new batch on the next run
+        os.remove(batch_id_path)
+        return successful
+    
+    def translate_all(self, claude_code_cmd: str = "claude-code", resume: bool = True,
+                      concurrency: int = DEFAULT_CONCURRENCY, reuse_session: bool = False,
+                      max_retries: int = DEFAULT_MAX_RETRIES) -> int:
+        """Translate all chunks, running up to concurrency Claude Code calls at once."""
+        _ensure_logging()
+        items, skipped = self.plan_work(resume)
+        successful = skipped + self.execute_work(items, claude_code_cmd, concurrency,
+                                                 reuse_session, max_retries)
+        
+        logger.info("\nTranslation complete: %d/%d chunks successful", successful, skipped + len(items))
+        return successful
+    
+    async def translate_all_async(self, resume: bool = True, concurrency: int = DEFAULT_CONCURRENCY,
+                                  max_retries: int = DEFAULT_MAX_RETRIES,
+                                  model: str = DEFAULT_API_MODEL) -> int:
+        """Translate all chunks through the Anthropic API, up to concurrency requests at once."""
+        _ensure_logging()
+        if anthropic is None:
+            logger.error("Error: --backend sdk requires the anthropic package (pip install anthropic)")
+            return 0
+        
+        items, skipped = self.plan_work(resume)
+        successful = skipped + await self.execute_work_async(items, concurrency, max_retries, model)
+        
+        logger.info("\nTranslation complete: %d/%d chunks successful", successful, skipped + len(items))
+        return successful
+    
+    def translate_all_batch(self, resume: bool = True, model: str = DEFAULT_API_MODEL,
+                            max_retries: int = DEFAULT_MAX_RETRIES) -> int:
+        """Translate all chunks in one Anthropic Message Batches API submission."""
+        _ensure_logging()
+        if anthropic is None:
+            logger.error("Error: --use-batch-api requires the anthropic package (pip install anthropic)")
+            return 0
+        
+        items, skipped = self.plan_work(resume)
+        successful = skipped + self.execute_work_batch(items, model, resume, max_retries)
+        
+        logger.info("\nTranslation complete: %d/%d chunks successful", successful, skipped + len(items))
         return successful
     
     def show_progress(self) -> None:
         """Show current translation progress."""
         try:
-            prompt_files = self.get_prompt_files()
-            existing_translations = self.get_existing_translations()
+            prompt_files = self.prompt_files
+            completed_nums = self.get_existing_chunk_numbers()
             
             total_chunks = len(prompt_files)
-            completed_chunks = len(existing_translations)
+            completed_chunks = len(completed_nums)
             
             print(f"Translation Progress for {self.movie_name}:")
             print(f"Completed: {completed_chunks}/{total_chunks} ({completed_chunks/total_chunks*100:.1f}%)")
             
             if completed_chunks < total_chunks:
-                completed_nums = {self.extract_chunk_number(f) for f in existing_translations}
                 all_nums = {self.extract_chunk_number(f) for f in prompt_files}
                 missing = sorted(all_nums - completed_nums)
                 print(f"Missing chunks: {missing}")
@@ -171,6 +636,23 @@ def main():
                        help='Claude Code command (default: claude-code)')
     parser.add_argument('--no-resume', action='store_true', 
                        help='Start fresh (don\'t resume from existing translations)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                       help=f'Number of chunks to translate in parallel (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--reuse-session', action='store_true',
+                       help='Start each parallel worker\'s next Claude Code process while its current '
+                            'chunk is answered, hiding startup time (every chunk still gets a fresh conversation)')
+    parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES,
+                       help=f'Retries per chunk (or batch API call) on rate limits, overload or timeouts '
+                            f'(default: {DEFAULT_MAX_RETRIES})')
+    parser.add_argument('--use-batch-api', action='store_true',
+                       help='Submit all chunks to the Anthropic Message Batches API (needs anthropic and ANTHROPIC_API_KEY)')
+    parser.add_argument('--backend', choices=['sdk', 'cli'], default=_default_backend(),
+                       help='Call the Anthropic API directly (sdk) or run Claude Code (cli); '
+                            'default: sdk when ANTHROPIC_API_KEY is set and anthropic is installed')
+    parser.add_argument('--model', default=DEFAULT_API_MODEL,
+                       help=f'Model for --backend sdk and --use-batch-api (default: {DEFAULT_API_MODEL})')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Only show warnings and errors while translating')
     
     if len(sys.argv) == 1:
         parser.print_help()
@@ -178,6 +660,11 @@ def main():
         print("  python translate_batch.py movies/My_Movie translate")
         print("  python translate_batch.py movies/My_Movie progress")
         print("  python translate_batch.py movies/My_Movie translate --claude-cmd 'claude'")
+        print("  python translate_batch.py movies/My_Movie translate --concurrency 1")
+        print("  python translate_batch.py movies/My_Movie translate --reuse-session")
+        print("  python translate_batch.py movies/My_Movie translate --backend sdk")
+        print("  python translate_batch.py movies/My_Movie translate --use-batch-api")
+        print("  python translate_batch.py movies/My_Movie translate --quiet")
         sys.exit(1)
     
     args = parser.parse_args()
@@ -187,24 +674,45 @@ def main():
         sys.exit(1)
     
     translator = BatchTranslator(args.movie_folder)
+    listener = _start_logging(quiet=args.quiet)
     
     try:
         if args.command == 'progress':
             translator.show_progress()
         elif args.command == 'translate':
-            successful = translator.translate_all(
-                claude_code_cmd=args.claude_cmd, 
-                resume=not args.no_resume
-            )
+            if args.use_batch_api:
+                successful = translator.translate_all_batch(
+                    resume=not args.no_resume,
+                    model=args.model,
+                    max_retries=args.max_retries
+                )
+            elif args.backend == 'sdk':
+                successful = asyncio.run(translator.translate_all_async(
+                    resume=not args.no_resume,
+                    concurrency=args.concurrency,
+                    max_retries=args.max_retries,
+                    model=args.model
+                ))
+            else:
+                successful = translator.translate_all(
+                    claude_code_cmd=args.claude_cmd, 
+                    resume=not args.no_resume,
+                    concurrency=args.concurrency,
+                    reuse_session=args.reuse_session,
+                    max_retries=args.max_retries
+                )
             
             if successful > 0:
-                print(f"\nNext step: python tools/reassemble_translation.py {args.movie_folder} assemble")
+                logger.info("\nNext step: python tools/reassemble_translation.py %s assemble", args.movie_folder)
             
     except KeyboardInterrupt:
-        print("\nTranslation interrupted. Progress saved. Run again to resume.")
+        logger.warning("\nTranslation interrupted. Progress saved. Run again to resume.")
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
+    finally:
+        # Flush everything still queued before the process exits
+        listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file